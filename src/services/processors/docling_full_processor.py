@@ -10,23 +10,53 @@ This processor:
 Section detection is based on common CoStar report headers that appear at the top of pages.
 """
 
+# Annotations must stay lazy: some reference docling names that are only
+# bound once _load_docling() runs
+from __future__ import annotations
+
 import json
 import sys
 import logging
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat, ConversionStatus
-from docling.datamodel.pipeline_options import (
-    PdfPipelineOptions,
-    EasyOcrOptions,
-    TableFormerMode,
-)
-from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling_core.types.doc import DocItemLabel, TextItem, TableItem
+import pandas as pd
+
+# Docling pulls in the full ML model stack (torch, easyocr, ...) at import
+# time, which dominates CLI cold start. Defer those imports until the first
+# processor is constructed so usage/validation error paths exit immediately.
+_DOCLING_LOADED = False
+
+
+def _load_docling() -> None:
+    """Import the heavy docling modules into module globals on first use."""
+    global _DOCLING_LOADED
+    global DocumentConverter, PdfFormatOption, InputFormat, ConversionStatus
+    global PdfPipelineOptions, EasyOcrOptions, TableFormerMode
+    global AcceleratorDevice, AcceleratorOptions, PyPdfiumDocumentBackend
+    global DocItemLabel, TextItem, TableItem, _SECTION_HEADER_LABEL
+
+    if _DOCLING_LOADED:
+        return
+
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.base_models import InputFormat, ConversionStatus
+    from docling.datamodel.pipeline_options import (
+        PdfPipelineOptions,
+        EasyOcrOptions,
+        TableFormerMode,
+    )
+    from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    from docling_core.types.doc import DocItemLabel, TextItem, TableItem
+
+    _SECTION_HEADER_LABEL = DocItemLabel.SECTION_HEADER
+    _DOCLING_LOADED = True
 
 # Configure logging to stderr so stdout is clean for JSON output
 logging.basicConfig(
@@ -87,6 +117,38 @@ COSTAR_SECTIONS = {
     ]
 }
 
+# Single precompiled alternation over all section patterns. Named groups map a
+# match back to its section slug, so a page can be classified with one C-level
+# scan instead of ~30 Python-level substring checks.
+SECTION_REGEX = re.compile(
+    "|".join(
+        f"(?P<{slug}>{'|'.join(re.escape(p) for p in patterns)})"
+        for slug, patterns in COSTAR_SECTIONS.items()
+    ),
+    re.IGNORECASE
+)
+
+# Optional Aho-Corasick automaton for multi-pattern section detection. A single
+# DFA pass over the page text with no backtracking beats the regex alternation
+# on long OCR'd pages; fall back to SECTION_REGEX when the dependency is absent.
+try:
+    import ahocorasick
+
+    SECTION_AUTOMATON = ahocorasick.Automaton()
+    for _slug, _patterns in COSTAR_SECTIONS.items():
+        for _pattern in _patterns:
+            SECTION_AUTOMATON.add_word(_pattern.lower(), _slug)
+    SECTION_AUTOMATON.make_automaton()
+except ImportError:
+    SECTION_AUTOMATON = None
+
+# Optional orjson for section file serialization - serializes to bytes in C,
+# several times faster than stdlib json on the large per-section payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Human-readable section names
 SECTION_NAMES = {
     "subject_property": "Subject Property",
@@ -100,6 +162,105 @@ SECTION_NAMES = {
 }
 
 
+# Enum members are singletons, so the section-header label check can be an
+# identity comparison; str(label) results are likewise cached per member.
+# _SECTION_HEADER_LABEL is bound by _load_docling().
+_SECTION_HEADER_LABEL = None
+_LABEL_STR_CACHE: Dict[Any, str] = {}
+
+
+def _label_str(label) -> str:
+    """Stringify a docling item label, caching per enum member."""
+    try:
+        return _LABEL_STR_CACHE[label]
+    except KeyError:
+        text = str(label)
+        _LABEL_STR_CACHE[label] = text
+        return text
+    except TypeError:
+        # Unhashable label objects are rare; fall back to direct str()
+        return str(label)
+
+
+# Concrete item classes seen per document are few; classify each type once and
+# dispatch on a dict hit afterwards instead of re-running isinstance per item.
+_ITEM_KIND_CACHE: Dict[type, str] = {}
+
+
+def _item_kind(item_type: type) -> str:
+    """Classify a docling item type as 'text', 'table', or 'other' (cached)."""
+    try:
+        return _ITEM_KIND_CACHE[item_type]
+    except KeyError:
+        if issubclass(item_type, TextItem):
+            kind = "text"
+        elif issubclass(item_type, TableItem):
+            kind = "table"
+        else:
+            kind = "other"
+        _ITEM_KIND_CACHE[item_type] = kind
+        return kind
+
+
+def _new_page_entry() -> Dict[str, Any]:
+    """Factory for a fresh page accumulator (page_number stamped afterwards)."""
+    return {
+        "page_number": 0,
+        "text_items": [],
+        "tables": [],
+        "headers": [],
+        "raw_text_parts": []
+    }
+
+
+def _scan_section_text(text: str) -> Optional[str]:
+    """Run the section matcher (automaton or regex) over a text blob."""
+    if SECTION_AUTOMATON is not None:
+        for _, section_slug in SECTION_AUTOMATON.iter(text.lower()):
+            return section_slug
+        return None
+
+    match = SECTION_REGEX.search(text)
+    return match.lastgroup if match else None
+
+
+@lru_cache(maxsize=4096)
+def _detect_section_cached(text: str) -> Optional[str]:
+    """
+    Detect which CoStar section a piece of text belongs to.
+
+    Header strings and boilerplate text items repeat on nearly every page of a
+    report, so results are memoized on the exact string.
+    """
+    return _scan_section_text(text)
+
+
+def _convert_page_batch(file_path: str, page_range: Tuple[int, int], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker entry point: convert one page batch in a separate process.
+
+    Builds a fresh (non-batching) processor in the worker and returns plain
+    dict/list structures so results pickle cheaply back to the parent.
+    """
+    processor = DoclingFullProcessor(**options)
+    result = processor.converter.convert(file_path, page_range=page_range)
+
+    if result.status == ConversionStatus.FAILURE:
+        return {
+            "status": "failure",
+            "page_range": page_range,
+            "errors": [str(e) for e in result.errors] if result.errors else []
+        }
+
+    doc = result.document
+    return {
+        "status": "success",
+        "page_range": page_range,
+        "pages": processor._extract_pages(doc),
+        "tables": processor._extract_tables(doc)
+    }
+
+
 class DoclingFullProcessor:
     """
     Full PDF processor using Docling for ML-based document understanding.
@@ -120,23 +281,39 @@ class DoclingFullProcessor:
         table_mode: str = "accurate",
         num_threads: int = 4,
         ocr_languages: List[str] = None,
-        ocr_confidence_threshold: float = 0.5
+        ocr_confidence_threshold: float = 0.5,
+        use_pypdfium: bool = True,
+        page_batch_size: Optional[int] = None,
+        include_table_exports: bool = False
     ):
         """
         Initialize the Docling full processor with configurable options.
-        
+
         Args:
             do_ocr: Enable OCR for scanned documents
             table_mode: "accurate" (slower, better) or "fast" (faster, less accurate)
             num_threads: Number of threads for processing
             ocr_languages: List of language codes for OCR (default: ["en"])
             ocr_confidence_threshold: Minimum confidence for OCR results
+            use_pypdfium: Parse PDFs with the pypdfium backend (lower memory,
+                faster page loading than the default docling parser)
+            page_batch_size: If set, convert the document in batches of this
+                many pages across worker processes (sidesteps the GIL for
+                large documents)
+            include_table_exports: Also render each table to markdown/HTML.
+                Downstream consumers only read headers/rows, so this is off
+                by default
         """
+        _load_docling()
+
         self.do_ocr = do_ocr
         self.table_mode = TableFormerMode.ACCURATE if table_mode == "accurate" else TableFormerMode.FAST
         self.num_threads = num_threads
         self.ocr_languages = ocr_languages or ["en"]
         self.ocr_confidence_threshold = ocr_confidence_threshold
+        self.use_pypdfium = use_pypdfium
+        self.page_batch_size = page_batch_size
+        self.include_table_exports = include_table_exports
         
         # Initialize the converter with configured options
         self.converter = self._create_converter()
@@ -167,14 +344,21 @@ class DoclingFullProcessor:
         )
         
         # Create converter with PDF format options
+        pdf_format_option = PdfFormatOption(pipeline_options=pipeline_options)
+        if self.use_pypdfium:
+            pdf_format_option = PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend
+            )
+
         converter = DocumentConverter(
             format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                InputFormat.PDF: pdf_format_option
             }
         )
-        
+
         return converter
-    
+
     def _detect_section_from_text(self, text: str) -> Optional[str]:
         """
         Detect which CoStar section a piece of text belongs to.
@@ -187,16 +371,8 @@ class DoclingFullProcessor:
         """
         if not text:
             return None
-            
-        text_upper = text.upper()
-        
-        # Check each section's patterns
-        for section_slug, patterns in COSTAR_SECTIONS.items():
-            for pattern in patterns:
-                if pattern.upper() in text_upper:
-                    return section_slug
-        
-        return None
+
+        return _detect_section_cached(text)
     
     def _get_page_section(self, page_text_items: List[Dict], page_headers: List[Dict]) -> str:
         """
@@ -211,18 +387,27 @@ class DoclingFullProcessor:
         Returns:
             Section slug
         """
-        # First check headers (most reliable)
-        for header in page_headers:
-            section = self._detect_section_from_text(header.get("text", ""))
-            if section:
-                return section
-        
-        # Check first few text items (section indicators are usually at top)
-        for item in page_text_items[:5]:
-            section = self._detect_section_from_text(item.get("text", ""))
+        # Gather candidate text: headers first (most reliable), then the text
+        # items physically highest on the page - section banners sit at the
+        # top, and provenance coordinates are more reliable than OCR reading
+        # order. Fall back to reading order when no coordinates are available.
+        positioned = [i for i in page_text_items if i.get("bbox_top") is not None]
+        if positioned:
+            candidates = sorted(positioned, key=lambda i: i["bbox_top"], reverse=True)[:5]
+        else:
+            candidates = page_text_items[:5]
+
+        parts = [h.get("text", "") for h in page_headers]
+        parts.extend(item.get("text", "") for item in candidates)
+        blob = "\n".join(p for p in parts if p)
+
+        if blob:
+            # One matcher pass over the joined candidates instead of a
+            # separate scan per header/item
+            section = _scan_section_text(blob)
             if section:
                 return section
-        
+
         # If no section detected, return unknown
         return "unknown"
     
@@ -248,41 +433,57 @@ class DoclingFullProcessor:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
             
-            # Convert the document (no page limit)
-            result = self.converter.convert(file_path)
-            
-            # Check conversion status
-            if result.status == ConversionStatus.FAILURE:
-                return {
-                    "processing_status": "error",
-                    "error_message": "Document conversion failed",
-                    "errors": [str(e) for e in result.errors] if result.errors else []
-                }
-            
-            doc = result.document
-            
-            # Extract base metadata
-            metadata = self._extract_metadata(result, file_path)
-            
-            # Extract pages with content
-            pages = self._extract_pages(doc)
-            
-            # Extract all tables
-            tables = self._extract_tables(doc)
-            
-            # Assign sections to pages
-            page_sections = self._assign_page_sections(pages)
-            
-            # Group content by section
-            sections_data = self._group_by_section(pages, tables, page_sections)
+            if self.page_batch_size:
+                # Convert page batches in parallel worker processes
+                pages, tables, metadata = self._convert_in_batches(file_path)
+                conversion_status = ConversionStatus.SUCCESS
+                conversion_errors = []
+            else:
+                # Convert the document (no page limit)
+                result = self.converter.convert(file_path)
+
+                # Check conversion status
+                conversion_status = result.status
+                conversion_errors = [str(e) for e in result.errors] if result.errors else []
+                if conversion_status == ConversionStatus.FAILURE:
+                    return {
+                        "processing_status": "error",
+                        "error_message": "Document conversion failed",
+                        "errors": conversion_errors
+                    }
+
+                doc = result.document
+
+                # Extract base metadata
+                metadata = self._extract_metadata(result, file_path)
+
+                # Extract pages with content
+                pages = self._extract_pages(doc)
+
+                # Extract all tables
+                tables = self._extract_tables(doc)
+
+                # Everything needed lives in plain dicts/lists now; drop the
+                # docling document and conversion result so their page images
+                # and model outputs can be reclaimed before grouping/writing
+                del doc
+                del result
+
+            # Group content by section (section assignment happens inline)
+            sections_data = self._group_by_section(pages, tables)
             
             # Generate base filename for outputs
             base_filename = Path(file_path).stem
             
-            # Write section files and collect paths
+            # Write section files and collect paths. Each section is submitted
+            # to the writer pool as soon as it is assembled, so serialization
+            # and disk I/O stream out incrementally while later sections are
+            # still being built.
             section_files = []
             section_summary = []
-            
+            write_futures = []
+            writer_pool = ThreadPoolExecutor(max_workers=4)
+
             for section_slug, section_content in sections_data.items():
                 # Skip unknown sections with no content
                 if section_slug == "unknown" and not section_content["pages"]:
@@ -308,13 +509,13 @@ class DoclingFullProcessor:
                     }
                 }
                 
-                # Write section file
+                # Stream the section file write out immediately
                 section_filename = f"e_{base_filename}_{section_slug}.json"
                 section_filepath = output_path / section_filename
-                
-                with open(section_filepath, 'w', encoding='utf-8') as f:
-                    json.dump(section_output, f, indent=2, default=str)
-                
+                write_futures.append(
+                    writer_pool.submit(self._write_section_file, section_filepath, section_output)
+                )
+
                 section_files.append(str(section_filepath))
                 section_summary.append({
                     "section": section_slug,
@@ -329,10 +530,17 @@ class DoclingFullProcessor:
                 })
                 
                 logger.info(f"Wrote section file: {section_filename} ({len(section_content['pages'])} pages)")
-            
+
+            # Wait for all streamed writes to land (surfacing any write error)
+            try:
+                for future in write_futures:
+                    future.result()
+            finally:
+                writer_pool.shutdown()
+
             # Build summary result
             output = {
-                "processing_status": "success" if result.status == ConversionStatus.SUCCESS else "partial_success",
+                "processing_status": "success" if conversion_status == ConversionStatus.SUCCESS else "partial_success",
                 "metadata": {
                     **metadata,
                     "total_sections": len(section_files),
@@ -341,9 +549,9 @@ class DoclingFullProcessor:
                 "sections": section_summary,
                 "section_files": section_files
             }
-            
-            if result.status == ConversionStatus.PARTIAL_SUCCESS:
-                output["warnings"] = [str(e) for e in result.errors] if result.errors else []
+
+            if conversion_status == ConversionStatus.PARTIAL_SUCCESS:
+                output["warnings"] = conversion_errors
             
             logger.info(f"Successfully processed PDF: {metadata.get('page_count', 'unknown')} pages, {len(section_files)} sections")
             return output
@@ -357,6 +565,85 @@ class DoclingFullProcessor:
                 "error_message": str(e)
             }
     
+    def _convert_in_batches(self, file_path: str) -> Tuple[Dict[int, Dict], List[Dict], Dict[str, Any]]:
+        """
+        Convert a large PDF as parallel page batches across worker processes.
+
+        Each worker converts a contiguous page range and extracts pages/tables
+        in-process; the parent merges the plain-dict results. Page numbers come
+        from provenance, so batches merge without offset fixups.
+
+        Returns:
+            Tuple of (pages dict, tables list, metadata dict)
+        """
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            page_count = len(pdf)
+        finally:
+            pdf.close()
+
+        batch_size = self.page_batch_size
+        batches = [
+            (start, min(start + batch_size - 1, page_count))
+            for start in range(1, page_count + 1, batch_size)
+        ]
+
+        # Workers rebuild the converter from the same options (minus batching)
+        worker_options = {
+            "do_ocr": self.do_ocr,
+            "table_mode": "accurate" if self.table_mode == TableFormerMode.ACCURATE else "fast",
+            "num_threads": self.num_threads,
+            "ocr_languages": self.ocr_languages,
+            "ocr_confidence_threshold": self.ocr_confidence_threshold,
+            "use_pypdfium": self.use_pypdfium,
+            "include_table_exports": self.include_table_exports
+        }
+
+        logger.info(f"Converting {page_count} pages in {len(batches)} parallel batches of {batch_size}")
+
+        pages: Dict[int, Dict] = {}
+        tables: List[Dict] = []
+
+        with ProcessPoolExecutor(max_workers=min(len(batches), 4)) as executor:
+            futures = [
+                executor.submit(_convert_page_batch, file_path, batch, worker_options)
+                for batch in batches
+            ]
+            for future in futures:
+                batch_result = future.result()
+                if batch_result["status"] == "failure":
+                    raise RuntimeError(
+                        f"Conversion failed for pages {batch_result['page_range']}: "
+                        f"{'; '.join(batch_result['errors']) or 'unknown error'}"
+                    )
+                pages.update(batch_result["pages"])
+                for table in batch_result["tables"]:
+                    table["table_index"] = len(tables)
+                    tables.append(table)
+
+        metadata = {
+            "file_name": Path(file_path).name,
+            "file_path": str(file_path),
+            "file_size": Path(file_path).stat().st_size,
+            "page_count": page_count,
+            "format": "PDF",
+            "processor": "docling_full",
+            "ocr_enabled": self.do_ocr,
+            "table_mode": "accurate" if self.table_mode == TableFormerMode.ACCURATE else "fast"
+        }
+
+        return pages, tables, metadata
+
+    def _write_section_file(self, section_filepath: Path, section_output: Dict[str, Any]) -> None:
+        """Serialize a section to one buffer and write it with a single call."""
+        if orjson is not None:
+            buffer = orjson.dumps(section_output, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            buffer = json.dumps(section_output, indent=2, default=str).encode('utf-8')
+        section_filepath.write_bytes(buffer)
+
     def _extract_metadata(self, result, file_path: str) -> Dict[str, Any]:
         """Extract document metadata."""
         return {
@@ -372,49 +659,54 @@ class DoclingFullProcessor:
     
     def _extract_pages(self, doc) -> Dict[int, Dict[str, Any]]:
         """Extract content organized by page."""
-        pages = {}
-        
+        pages: Dict[int, Dict[str, Any]] = defaultdict(_new_page_entry)
+
+
         # Iterate through all items and organize by page
         for item, level in doc.iterate_items():
             page_num = 1  # Default to page 1
-            
-            # Get page number from provenance
+            bbox_top = None
+
+            # Get page number and vertical position from provenance
             if hasattr(item, 'prov') and item.prov and len(item.prov) > 0:
-                page_num = item.prov[0].page_no if hasattr(item.prov[0], 'page_no') else 1
-            
-            if page_num not in pages:
-                pages[page_num] = {
-                    "page_number": page_num,
-                    "text_items": [],
-                    "tables": [],
-                    "headers": [],
-                    "raw_text_parts": []
-                }
-            
-            # Categorize the item
-            if isinstance(item, TextItem):
+                prov = item.prov[0]
+                page_num = prov.page_no if hasattr(prov, 'page_no') else 1
+                bbox_top = getattr(getattr(prov, 'bbox', None), 't', None)
+
+            page = pages[page_num]
+
+            # Categorize the item (type classification is cached per class)
+            kind = _item_kind(type(item))
+            if kind == "text":
                 text = item.text if hasattr(item, 'text') else ""
-                pages[page_num]["raw_text_parts"].append(text)
-                
-                if hasattr(item, 'label') and item.label == DocItemLabel.SECTION_HEADER:
-                    pages[page_num]["headers"].append({
+                page["raw_text_parts"].append(text)
+
+                label = getattr(item, 'label', None)
+                if label is _SECTION_HEADER_LABEL:
+                    page["headers"].append({
                         "text": text,
                         "level": level
                     })
                 else:
-                    pages[page_num]["text_items"].append({
+                    page["text_items"].append({
                         "text": text,
-                        "label": str(item.label) if hasattr(item, 'label') else "text",
-                        "level": level
+                        "label": _label_str(label) if label is not None else "text",
+                        "level": level,
+                        "bbox_top": bbox_top
                     })
-            elif isinstance(item, TableItem):
+            elif kind == "table":
                 # Tables are extracted separately but we track their page location
-                pages[page_num]["tables"].append({
+                page["tables"].append({
                     "table_ref": id(item),
                     "level": level
                 })
-        
-        return pages
+
+        # Stamp page numbers (the defaultdict factory cannot see its key) and
+        # hand back a plain dict so lookups downstream never auto-create pages
+        for page_num, page in pages.items():
+            page["page_number"] = page_num
+
+        return dict(pages)
     
     def _extract_tables(self, doc) -> List[Dict[str, Any]]:
         """
@@ -431,18 +723,19 @@ class DoclingFullProcessor:
                 
                 # Get headers (column names)
                 headers = list(df.columns)
-                
-                # Convert rows to list of dicts
-                rows = df.to_dict(orient="records")
-                
+
+                # Build row dicts straight from the underlying ndarray; this
+                # skips the per-cell pandas machinery behind to_dict("records")
+                rows = [dict(zip(headers, row)) for row in df.to_numpy(dtype=object)]
+
                 # Detect column types
                 column_types = self._detect_column_types(df)
-                
+
                 # Get page number from provenance
                 page_num = 1
                 if hasattr(table, 'prov') and table.prov and len(table.prov) > 0:
                     page_num = table.prov[0].page_no if hasattr(table.prov[0], 'page_no') else 1
-                
+
                 table_data = {
                     "table_index": table_idx,
                     "page_number": page_num,
@@ -450,10 +743,14 @@ class DoclingFullProcessor:
                     "column_types": column_types,
                     "rows": rows,
                     "row_count": len(df),
-                    "column_count": len(df.columns),
-                    "markdown": df.to_markdown() if len(df) > 0 else "",
-                    "html": table.export_to_html(doc=doc) if hasattr(table, 'export_to_html') else None
+                    "column_count": len(df.columns)
                 }
+
+                # Rendered formats are expensive per table and unused by the
+                # transformer pipeline; only produce them on request
+                if self.include_table_exports:
+                    table_data["markdown"] = df.to_markdown() if len(df) > 0 else ""
+                    table_data["html"] = table.export_to_html(doc=doc) if hasattr(table, 'export_to_html') else None
                 
                 tables.append(table_data)
                 
@@ -474,87 +771,49 @@ class DoclingFullProcessor:
         Types: numeric, currency, percentage, text, empty
         """
         column_types = {}
-        
+
         for col in df.columns:
-            values = df[col].dropna().astype(str).tolist()
-            
-            if not values:
+            values = df[col].dropna().astype(str).str.strip()
+
+            if values.empty:
                 column_types[col] = "empty"
                 continue
-            
+
+            is_blank = values == ''
+
             # Check for currency ($ prefix)
-            if all(v.strip().startswith('$') or v.strip() == '' for v in values):
+            if (values.str.startswith('$') | is_blank).all():
                 column_types[col] = "currency"
             # Check for percentage (% suffix)
-            elif all(v.strip().endswith('%') or v.strip() == '' for v in values):
+            elif (values.str.endswith('%') | is_blank).all():
                 column_types[col] = "percentage"
-            # Check for numeric
-            elif all(self._is_numeric(v) for v in values):
-                column_types[col] = "numeric"
+            # Check for numeric (allowing empty/placeholder values)
             else:
-                column_types[col] = "text"
-        
+                clean = values.str.replace(',', '', regex=False).str.replace(' ', '', regex=False)
+                placeholder = is_blank | (clean == '-') | (clean.str.lower() == 'n/a')
+                if (pd.to_numeric(clean, errors='coerce').notna() | placeholder).all():
+                    column_types[col] = "numeric"
+                else:
+                    column_types[col] = "text"
+
         return column_types
     
-    def _is_numeric(self, value: str) -> bool:
-        """Check if a string value is numeric."""
-        try:
-            clean = value.replace(',', '').replace(' ', '').strip()
-            if clean == '' or clean == '-' or clean.lower() == 'n/a':
-                return True
-            float(clean)
-            return True
-        except ValueError:
-            return False
-    
-    def _assign_page_sections(self, pages: Dict[int, Dict]) -> Dict[int, str]:
-        """
-        Assign each page to a section based on its content.
-        
-        Uses a "sticky" approach where section assignment persists until
-        a new section is detected.
-        
-        Args:
-            pages: Dictionary of page data keyed by page number
-            
-        Returns:
-            Dictionary mapping page number to section slug
-        """
-        page_sections = {}
-        current_section = "unknown"
-        
-        for page_num in sorted(pages.keys()):
-            page_data = pages[page_num]
-            
-            # Try to detect section from this page's content
-            detected_section = self._get_page_section(
-                page_data.get("text_items", []),
-                page_data.get("headers", [])
-            )
-            
-            # Update current section if a new one is detected
-            if detected_section != "unknown":
-                current_section = detected_section
-            
-            page_sections[page_num] = current_section
-            logger.debug(f"Page {page_num} assigned to section: {current_section}")
-        
-        return page_sections
-    
     def _group_by_section(
         self,
         pages: Dict[int, Dict],
-        tables: List[Dict],
-        page_sections: Dict[int, str]
+        tables: List[Dict]
     ) -> Dict[str, Dict]:
         """
-        Group pages and tables by their assigned section.
-        
+        Assign each page to a section and group pages/tables in one pass.
+
+        Section assignment is "sticky": a page keeps the most recently
+        detected section until a new one is detected, so assignment and
+        grouping fold into a single iteration over the sorted pages.
+
         Args:
             pages: Dictionary of page data
             tables: List of table data
-            page_sections: Mapping of page numbers to sections
-            
+
         Returns:
             Dictionary of section data keyed by section slug
         """
@@ -565,16 +824,29 @@ class DoclingFullProcessor:
             sections_data[section_slug] = {
                 "pages": [],
                 "tables": [],
-                "raw_text": "",
+                "raw_text_parts": [],
                 "start_page": None,
                 "end_page": None
             }
         
-        # Group pages by section
+        # Assign and group pages by section in one iteration
+        page_sections = {}
+        current_section = "unknown"
         for page_num in sorted(pages.keys()):
-            section = page_sections.get(page_num, "unknown")
             page_data = pages[page_num]
-            
+
+            detected_section = self._get_page_section(
+                page_data.get("text_items", []),
+                page_data.get("headers", [])
+            )
+            if detected_section != "unknown":
+                current_section = detected_section
+
+            section = current_section
+            page_sections[page_num] = section
+            logger.debug(f"Page {page_num} assigned to section: {section}")
+
+
             # Clean page data for output (remove internal fields)
             clean_page = {
                 "page_number": page_data["page_number"],
@@ -585,9 +857,10 @@ class DoclingFullProcessor:
             
             sections_data[section]["pages"].append(clean_page)
             
-            # Accumulate raw text
+            # Accumulate raw text parts (joined once at the end to avoid
+            # quadratic str += growth on large sections)
             raw_text_parts = page_data.get("raw_text_parts", [])
-            sections_data[section]["raw_text"] += "\n".join(raw_text_parts) + "\n\n"
+            sections_data[section]["raw_text_parts"].append("\n".join(raw_text_parts) + "\n\n")
             
             # Track page range
             if sections_data[section]["start_page"] is None:
@@ -600,12 +873,16 @@ class DoclingFullProcessor:
             section = page_sections.get(page_num, "unknown")
             sections_data[section]["tables"].append(table)
         
+        # Join accumulated text in a single pass per section
+        for data in sections_data.values():
+            data["raw_text"] = "".join(data.pop("raw_text_parts"))
+
         # Remove empty sections
         sections_data = {
             slug: data for slug, data in sections_data.items()
             if data["pages"] or data["tables"]
         }
-        
+
         return sections_data
 
 
@@ -6,10 +6,31 @@ CoStar/property report processing pipeline and expected output format.
 """
 
 import re
+import sys
+import copy
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import numpy as np
+
+# Optional: Aho-Corasick automaton for single-pass keyword detection
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: google-re2 for linear-time DFA matching of the hot fused
+# alternations (stdlib re backtracks; re2 cannot)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,6 +39,242 @@ logging.basicConfig(
 logger = logging.getLogger('docling_transformer')
 
 
+def _compile_fused(pattern: str, flags: int = 0):
+    """
+    Compile a hot fused alternation with google-re2 when it is installed,
+    falling back to stdlib re otherwise (or when re2 rejects the pattern).
+    The returned object keeps the re API surface the callers rely on
+    (search/finditer, lastgroup, groupindex).
+    """
+    if re2 is not None:
+        re2_flags = 0
+        if flags & re.IGNORECASE:
+            re2_flags |= re2.IGNORECASE
+        if flags & re.MULTILINE:
+            re2_flags |= re2.MULTILINE
+        if flags & re.DOTALL:
+            re2_flags |= re2.DOTALL
+        try:
+            return re2.compile(pattern, re2_flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Precompiled patterns for the hot parsing paths. Compiling once at import
+# and calling the pattern methods directly skips the re module's per-call
+# cache lookup, which adds up over batches of documents.
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+# One scan classifies an owner-column cell as price or date; no match means
+# it is the owner name. The price branch stays anchored to the cell start
+_OWNER_CELL_RE = re.compile(
+    r'^\$(?P<price>[\d,]+)(?:\s*\((?P<per_unit>[^)]+)\))?'
+    r'|(?P<purchased>Purchased\s+)?(?P<date>[A-Za-z]+\s+\d{4}|\d{1,2}/\d{1,2}/\d{4})'
+)
+_CURRENCY_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)')
+_PERCENT_RE = re.compile(r'([\d.]+)%?')
+_UNITS_RE = re.compile(r'(\()?([\d.]+)\)?\s*Units?', re.IGNORECASE)
+_AMENITY_BLOCK_RE = re.compile(r'(?:SITE\s+)?AMENITIES[:\s]*(.+?)(?=\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+# Folding all amenity delimiters to newlines lets one C-level translate +
+# split do the work of a character-class re.split
+_AMENITY_TRANS = str.maketrans(",•-", "\n\n\n")
+# Pre-stripped markdown table cells in one scan per row (the row gets a
+# pipe appended on each side so every cell sits between two delimiters)
+_MD_CELL_RE = re.compile(r'\|\s*([^|\n]+?)\s*(?=\|)')
+_ADMIN_FEE_RE = re.compile(r'Admin\s*Fee\s*\$?([\d,]+)', re.IGNORECASE)
+_APPLICATION_FEE_RE = re.compile(r'Application\s*Fee\s*\$?([\d,]+)', re.IGNORECASE)
+_DEPOSIT_RE = re.compile(r'Deposit\s*\$?([\d,]+)', re.IGNORECASE)
+# Matched against pet policy text that is lowercased once up front, so
+# the patterns compile without IGNORECASE
+_PET_RESTRICTION_RES = [
+    re.compile(p)
+    for p in (
+        r'breed restrictions?',
+        r'weight limit',
+        r'max (\d+) pets?',
+        r'pet deposit',
+        r'pet rent',
+    )
+]
+_VALUE_CURRENCY_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)')
+_VALUE_PERCENT_RE = re.compile(r'([\d.]+)%')
+_NA_STRINGS = frozenset({'-', 'n/a', 'na', ''})
+_HEADER_SPLIT_RE = re.compile(r'[\s_\-]+')
+_ADDRESS_NAME_RE = re.compile(r'^(.+?)\s+\d+\s+Unit')
+_ADDRESS_NAME_FALLBACK_RE = re.compile(r'^([A-Za-z\s]+)')
+_LOCATION_RE = re.compile(r'^([^,]+),\s*([A-Za-z\s]+?)(?:\s*-|$)')
+_METRICS_ROW_RE = _compile_fused(
+    r'\|\s*([^|]+):\s*\|\s*([^|]+)\|\s*([^|]+)\|\s*([^|]+):\s*\|\s*([^|]+)\|\s*([^|]+)\|\s*([^|]+):\s*\|\s*([^|]+)\|'
+)
+
+# Start of a recognizable raw_text block: a markdown section header, the
+# bare PET POLICY heading, or an image comment (which only ends a block)
+_RAW_BLOCK_RE = _compile_fused(
+    r'^(?:## (?P<header>[^\n]+)|(?P<pet>PET POLICY)\s*$|(?P<comment><!-- ))',
+    re.MULTILINE,
+)
+
+
+def _slice_raw_text(raw_text: str) -> Dict[str, str]:
+    """
+    Split raw_text into header -> body slices in one scan.
+
+    Each block extractor used to run its own full-document regex over
+    raw_text; this pass finds every block boundary once and the
+    extractors then read their slice by key. The first occurrence of a
+    header wins, matching the old re.search behavior.
+    """
+    slices: Dict[str, str] = {}
+
+    # Cheap substring sentinels: skip the block scan entirely when the
+    # text has no block boundaries to find
+    if '## ' not in raw_text and 'PET POLICY' not in raw_text:
+        return slices
+
+    pending_key = None
+    pending_start = 0
+
+    for match in _RAW_BLOCK_RE.finditer(raw_text):
+        if pending_key is not None and pending_key not in slices:
+            slices[pending_key] = raw_text[pending_start:match.start()].strip()
+
+        header = match.group('header') or match.group('pet')
+        if header:
+            pending_key = header.strip().upper()
+            pending_start = match.end()
+        else:
+            pending_key = None
+
+    if pending_key is not None and pending_key not in slices:
+        slices[pending_key] = raw_text[pending_start:].strip()
+
+    return slices
+
+
+def _table_columns(table: Dict) -> Dict[str, List[Any]]:
+    """
+    Build a columnar (header -> cell list) view of a table's row dicts.
+
+    Hot loops iterate these flat lists instead of re-hashing every row
+    dict; the row-dict shape stays the interchange format downstream.
+    """
+    columns: Dict[str, List[Any]] = {}
+    for row in table.get("rows", []):
+        for header, value in row.items():
+            col = columns.get(header)
+            if col is None:
+                col = columns[header] = []
+            col.append(value)
+    return columns
+
+
+def _new_metrics_skeleton() -> Dict[str, Any]:
+    """Empty metrics structure, allocated only once a metrics row matches."""
+    return {
+        "asking_rents": {
+            "current": {"per_unit": None, "per_sf": None},
+            "last_quarter": {"per_unit": None, "per_sf": None},
+            "year_ago": {"per_unit": None, "per_sf": None},
+            "competitors": {"per_unit": None, "per_sf": None},
+            "submarket": {"per_unit": None, "per_sf": None}
+        },
+        "vacancy": {
+            "current": {"rate": None, "units": None},
+            "last_quarter": {"rate": None, "units": None},
+            "year_ago": {"rate": None, "units": None},
+            "competitors": {"rate": None, "units": None},
+            "submarket": {"rate": None, "units": None}
+        },
+        "absorption": {
+            "current": None,
+            "competitor_total": None,
+            "competitor_avg": None,
+            "submarket_total": None,
+            "submarket_avg": None
+        }
+    }
+
+
+# Key-value extraction patterns, fused into one alternation so a single
+# finditer pass over the text serves every key. Each alternative's value
+# group is named <key>_<n>; the key is recovered from match.lastgroup
+_KV_RE = _compile_fused(
+    '|'.join((
+        r'(?P<no_of_units_0>\d+)\s*(?:Units?|Apartments?)',
+        r'Property\s+Size[:\s]*(?P<no_of_units_1>\d+)',
+        r'(?P<stories_0>\d+)\s*(?:Stor(?:y|ies)|Floor)',
+        r'Avg\.?\s*Unit\s*Size[:\s]*(?P<avg_unit_size_0>\d+(?:,\d+)?)\s*SF',
+        r'Average\s*(?:Unit\s*)?Size[:\s]*(?P<avg_unit_size_1>\d+)',
+        r'Year\s*Built[:\s]*(?P<year_built_0>\d{4})',
+        r'Built\s*(?:in\s*)?(?P<year_built_1>\d{4})',
+        r'Parking[:\s]*(?P<parking_0>.+?)(?:\n|$)',
+        r'Owner[:\s]*(?P<name_0>.+?)(?:\n|$)',
+        r'Property\s*Manager[:\s]*(?P<name_1>.+?)(?:\n|$)',
+        r'Purchase\s*Date[:\s]*(?P<purchase_date_0>.+?)(?:\n|$)',
+        r'Acquired[:\s]*(?P<purchase_date_1>.+?)(?:\n|$)',
+        r'Purchase\s*Price[:\s]*(?P<purchase_price_0>\$[\d,]+(?:\s*\([^)]+\))?)',
+        r'Sale\s*Price[:\s]*(?P<purchase_price_1>\$[\d,]+)',
+        r'Current[:\s]*(?P<current_0>[\d.]+%?\s*(?:Units?)?)',
+        r'Submarket(?:\s*Total)?[:\s]*(?P<submarket_total_0>[\d,]+\s*(?:Units?)?)',
+        r'Submarket\s*Avg[:\s]*(?P<submarket_avg_0>[\d.]+\s*(?:Units?)?)',
+    )),
+    re.IGNORECASE,
+)
+_KV_GROUP_TO_KEY = {
+    name: (name.rsplit('_', 1)[0], index)
+    for name, index in _KV_RE.groupindex.items()
+}
+
+# Property key normalization: known keys resolve through one dict hit, the
+# fallback rewrites spaces/dots in a single C-level translate
+_KEY_MAP = {
+    "no. of units": "no_of_units",
+    "stories": "stories",
+    "avg. unit size": "avg_unit_size",
+    "type": "property_type",
+    "rent type": "rent_type",
+    "year built": "year_built",
+    "parking": "parking",
+    "distance to transit": "distance_to_transit",
+}
+_KEY_TRANSLATE = str.maketrans({" ": "_", ".": None})
+
+# Utility keywords and their canonical display names, in output order
+_UTIL_CANON = {
+    "gas": "Gas", "water": "Water", "electricity": "Electricity",
+    "electric": "Electric", "heat": "Heat", "heating": "Heating",
+    "trash": "Trash", "garbage": "Garbage", "sewer": "Sewer",
+    "cable": "Cable", "internet": "Internet", "wifi": "Wifi",
+}
+
+# One automaton pass tags every utility in the text regardless of keyword
+# count; the fallback is the plain per-keyword substring scan
+if ahocorasick is not None:
+    _UTIL_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _UTIL_CANON:
+        _UTIL_AUTOMATON.add_word(_keyword, _keyword)
+    _UTIL_AUTOMATON.make_automaton()
+else:
+    _UTIL_AUTOMATON = None
+
+# State name -> USPS abbreviation, built once rather than per lookup
+_STATE_ABBREV = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
+    'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+}
+
+
 class DoclingTransformer:
     """
     Transforms Docling output to match the existing JSON schema used by the
@@ -93,7 +350,8 @@ class DoclingTransformer:
             r'TRANSACTION',
         ],
     }
-    
+
+
     # Table header patterns for classification
     TABLE_PATTERNS = {
         'unit_breakdown': [
@@ -116,32 +374,102 @@ class DoclingTransformer:
             r'per\s*unit',
         ],
     }
+
+    # Fused alternations, compiled once at import from the raw strings above:
+    # one regex call per table/section instead of a loop over every pattern in
+    # every category. For tables the named group of the match identifies the
+    # category directly
+    _TABLE_CATEGORY_RE = _compile_fused(
+        "|".join(
+            f"(?P<{table_type}>{'|'.join(patterns)})"
+            for table_type, patterns in TABLE_PATTERNS.items()
+        ),
+        re.IGNORECASE,
+    )
+    _SECTION_TYPE_RE = {
+        section_type: _compile_fused("|".join(patterns), re.IGNORECASE)
+        for section_type, patterns in SECTION_PATTERNS.items()
+    }
+    _SECTION_CATEGORY_RE = _compile_fused(
+        "|".join(
+            f"(?P<{section_type}>{'|'.join(patterns)})"
+            for section_type, patterns in SECTION_PATTERNS.items()
+        ),
+        re.IGNORECASE,
+    )
+    # Literal header tokens bucketed during the same classification pass;
+    # the block extractors read these buckets instead of re-uppercasing
+    # every header themselves
+    _HDR_TOKEN_BUCKETS = {
+        "UNIT AMENITIES": "unit_amenities",
+        "RECURRING EXPENSES": "recurring_expenses",
+        "ONE TIME EXPENSES": "one_time_expenses",
+    }
+    # Bucket types whose joined content is consumed as plain text
+    _TEXT_SECTION_TYPES = ('property', 'owner', 'vacancy', 'absorption')
+    # Max entries in the per-instance transform result cache
+    _CACHE_MAX = 128
+
+    def __init__(self, keep_raw: bool = False, use_cache: bool = False):
+        """
+        Initialize the transformer.
+
+        Args:
+            keep_raw: Retain the original tables/sections/pages in the
+                output as tables_raw/sections_raw/pages. They duplicate
+                what structured_data is derived from, roughly doubling
+                serialized output size, so they are off by default.
+                raw_text is always kept; the address extractor reads it.
+            use_cache: Memoize transform results keyed by a hash of the
+                input, so re-processing the same document (retries,
+                re-queues, previews) skips the extraction pipeline.
+        """
+        self.keep_raw = keep_raw
+        self.use_cache = use_cache
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
     
-    def __init__(self):
-        """Initialize the transformer."""
-        pass
-    
-    def transform(self, docling_output: Dict[str, Any]) -> Dict[str, Any]:
+    def transform(self, docling_output: Dict[str, Any], creation_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Transform Docling output to the expected JSON schema.
-        
+
         Args:
             docling_output: Raw output from DoclingProcessor.process()
-            
+            creation_date: Timestamp to stamp on the metadata. Batch
+                callers can pass one precomputed value instead of paying
+                a clock read and isoformat per document
+
         Returns:
             Transformed output matching existing schema
         """
-        if docling_output.get("processing_status") == "error":
+        get = docling_output.get
+        status = get("processing_status", "success")
+        if status == "error":
             return docling_output
-        
+
         try:
             # Extract components
-            metadata = docling_output.get("metadata", {})
-            tables = docling_output.get("tables", [])
-            sections = docling_output.get("sections", [])
-            pages = docling_output.get("pages", [])
-            raw_text = docling_output.get("raw_text", "")
-            
+            metadata = get("metadata") or {}
+            tables = get("tables") or []
+            sections = get("sections") or []
+            pages = get("pages") or []
+            raw_text = get("raw_text") or ""
+
+            # Re-processing the same document skips the pipeline; the key
+            # hashes raw_text and metadata (BLAKE2 is fast in CPython) plus
+            # the component counts. Hits are deep-copied so callers can
+            # mutate their result, with a fresh creation_date stamped on
+            cache_key = None
+            if self.use_cache:
+                digest = hashlib.blake2b(raw_text.encode('utf-8'), digest_size=16)
+                digest.update(repr(metadata).encode('utf-8'))
+                cache_key = (digest.digest(), len(tables), len(sections))
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    result = copy.deepcopy(cached)
+                    result["metadata"]["creation_date"] = creation_date or datetime.now().isoformat()
+                    return result
+
             # Build structured data
             structured_data = self._build_structured_data(
                 tables=tables,
@@ -161,18 +489,29 @@ class DoclingTransformer:
                 "total_tables": len(tables),
                 "ocr_enabled": metadata.get("ocr_enabled", True),
                 "table_mode": metadata.get("table_mode", "accurate"),
-                "creation_date": datetime.now().isoformat()
+                "creation_date": creation_date or datetime.now().isoformat()
             }
             
-            return {
-                "processing_status": docling_output.get("processing_status", "success"),
+            transformed = {
+                "processing_status": status,
                 "structured_data": [structured_data],
                 "metadata": transformed_metadata,
-                "tables_raw": tables,  # Preserve original table data
-                "sections_raw": sections,  # Preserve original sections
-                "pages": pages,
                 "raw_text": raw_text
             }
+
+            if self.keep_raw:
+                transformed["tables_raw"] = tables  # Preserve original table data
+                transformed["sections_raw"] = sections  # Preserve original sections
+                transformed["pages"] = pages
+
+            if cache_key is not None:
+                # Store a private copy so later caller mutations cannot
+                # poison the cache; evict least-recently-used beyond cap
+                self._cache[cache_key] = copy.deepcopy(transformed)
+                if len(self._cache) > self._CACHE_MAX:
+                    self._cache.popitem(last=False)
+
+            return transformed
             
         except Exception as e:
             logger.error(f"Error transforming Docling output: {str(e)}")
@@ -209,6 +548,19 @@ class DoclingTransformer:
         # Process tables and categorize them
         classified_tables = self._classify_tables(tables)
         
+        # Bucket section indices by type in one pass over the headers, so
+        # the extractors below each pull their bucket in O(1) instead of
+        # re-matching every header per extractor
+        section_buckets = self._classify_sections(sections)
+
+        # Join content once, and only for sections an extractor will
+        # actually read as text; other sections are never joined at all
+        section_texts = {
+            idx: " ".join(sections[idx].get("content", []))
+            for section_type in self._TEXT_SECTION_TYPES
+            for idx in section_buckets.get(section_type, ())
+        }
+
         # Initialize in document order
         property_data = {}
         property_manager_data = {}
@@ -229,40 +581,55 @@ class DoclingTransformer:
         
         # Fall back to section/text extraction if property info tables didn't provide data
         if not property_data:
-            property_data = self._extract_property_info(sections, raw_text)
+            property_data = self._extract_property_info(section_buckets, section_texts, raw_text)
         if not owner_data:
-            owner_data = self._extract_owner_info(sections, raw_text)
+            owner_data = self._extract_owner_info(section_buckets, section_texts, raw_text)
         
-        # Extract ASKING RENTS, VACANCY, and ABSORPTION from raw_text
-        metrics = self._extract_metrics_from_raw_text(raw_text)
+        # Slice raw_text by block header once; the block extractors below all
+        # read their slice instead of re-scanning the full document
+        raw_slices = _slice_raw_text(raw_text)
+
+        # The extractors below are independent of one another and spend
+        # their time in C-level regex scans, so overlap them on a small
+        # thread pool (mirrors the table-export rendering pool)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            metrics_future = pool.submit(self._extract_metrics_from_raw_text, raw_text)
+            amenities_future = pool.submit(
+                self._extract_all_amenities, sections, section_buckets, raw_slices, tables
+            )
+            recurring_future = pool.submit(
+                self._extract_recurring_expenses, sections, section_buckets, raw_slices
+            )
+            one_time_future = pool.submit(
+                self._extract_one_time_expenses, sections, section_buckets, raw_slices
+            )
+            pet_future = pool.submit(self._extract_pet_policy, sections, raw_slices)
+
+            metrics = metrics_future.result()
+            amenities = amenities_future.result()
+            recurring_expenses = recurring_future.result()
+            one_time_expenses = one_time_future.result()
+            pet_policy = pet_future.result()
+
+        # ASKING RENTS, VACANCY, and ABSORPTION come from the raw_text
+        # metrics table when present, else from the section fallbacks
         if metrics:
             asking_rents = metrics.get("asking_rents", {})
             vacancy = metrics.get("vacancy", {})
             absorption_rate = metrics.get("absorption", {})
         else:
             asking_rents = {}
-            vacancy = self._extract_rate_info(sections, raw_text, "vacancy")
-            absorption_rate = self._extract_rate_info(sections, raw_text, "absorption")
-        
+            vacancy = self._extract_rate_info(section_buckets, section_texts, "vacancy")
+            absorption_rate = self._extract_rate_info(section_buckets, section_texts, "absorption")
+
         # Extract unit breakdown
         unit_breakdown = []
         if classified_tables.get("unit_breakdown"):
             unit_breakdown = self._format_unit_breakdown(classified_tables["unit_breakdown"])
-        
-        # Extract amenities (site and unit separately)
-        amenities = self._extract_all_amenities(sections, raw_text, tables)
+
         site_amenities = amenities.get("site", [])
         unit_amenities = amenities.get("unit", [])
         
-        # Extract recurring expenses (utilities included)
-        recurring_expenses = self._extract_recurring_expenses(sections, raw_text)
-        
-        # Extract one time expenses
-        one_time_expenses = self._extract_one_time_expenses(sections, raw_text)
-        
-        # Extract pet policy
-        pet_policy = self._extract_pet_policy(sections, raw_text)
-        
         # Build structured output in document order
         structured = {
             "property": property_data,
@@ -319,12 +686,12 @@ class DoclingTransformer:
         if len(content) > 0:
             name_line = content[0]
             # Extract property name before "Unit" or numbers
-            name_match = re.match(r'^(.+?)\s+\d+\s+Unit', name_line)
+            name_match = _ADDRESS_NAME_RE.match(name_line)
             if name_match:
                 result["name"] = name_match.group(1).strip()
             else:
                 # Fallback: take first part before numbers
-                name_match = re.match(r'^([A-Za-z\s]+)', name_line)
+                name_match = _ADDRESS_NAME_FALLBACK_RE.match(name_line)
                 if name_match:
                     result["name"] = name_match.group(1).strip()
         
@@ -332,7 +699,7 @@ class DoclingTransformer:
         if len(content) > 1:
             location_line = content[1]
             # Parse "City, State - Neighborhood" format
-            location_match = re.match(r'^([^,]+),\s*([A-Za-z\s]+?)(?:\s*-|$)', location_line)
+            location_match = _LOCATION_RE.match(location_line)
             if location_match:
                 result["city"] = location_match.group(1).strip()
                 state_name = location_match.group(2).strip()
@@ -342,22 +709,7 @@ class DoclingTransformer:
     
     def _state_to_abbrev(self, state_name: str) -> str:
         """Convert state name to abbreviation."""
-        state_abbrevs = {
-            'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-            'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-            'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-            'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-            'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-            'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-            'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-            'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
-            'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-            'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
-            'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-            'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
-            'wisconsin': 'WI', 'wyoming': 'WY'
-        }
-        return state_abbrevs.get(state_name.lower(), state_name)
+        return _STATE_ABBREV.get(state_name.lower(), state_name)
     
     def _classify_tables(self, tables: List[Dict]) -> Dict[str, List[Dict]]:
         """Classify tables by type based on headers."""
@@ -374,52 +726,56 @@ class DoclingTransformer:
                 continue
                 
             headers = table.get("headers", [])
-            header_text = " ".join(str(h).lower() for h in headers)
-            
+            # One C-level lower() on the joined string beats a per-header lower()
+            header_text = " ".join(str(h) for h in headers).lower()
+
             # Check if this is a property info key-value table
             # Pattern: Has "PROPERTY" and "PROPERTY MANAGER" or "OWNER" in headers
-            if self._is_property_info_table(table):
+            if self._is_property_info_table(table, header_text):
                 classified["property_info"].append(table)
                 continue
             
-            matched = False
-            for table_type, patterns in self.TABLE_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, header_text, re.IGNORECASE):
-                        classified[table_type].append(table)
-                        matched = True
-                        break
-                if matched:
-                    break
-            
-            if not matched:
-                classified["other"].append(table)
+            classified[self._classify_header_text(header_text)].append(table)
         
         return classified
     
-    def _is_property_info_table(self, table: Dict) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_header_text(header_text: str) -> str:
+        """
+        Category for a joined lowercase header string.
+
+        CoStar templates repeat the same header layouts across reports, so
+        repeat schemas resolve from the cache without touching the regex.
+        """
+        match = DoclingTransformer._TABLE_CATEGORY_RE.search(header_text)
+        return match.lastgroup if match else "other"
+
+    def _is_property_info_table(self, table: Dict, header_text: str) -> bool:
         """
         Detect if a table is a property info key-value table.
-        
+
         These tables typically have:
         - Headers like "PROPERTY", "", "PROPERTY MANAGER"
         - Rows with key-value patterns like "No. of Units:", "144"
+
+        The caller passes the pre-joined lowercase header text so it is
+        computed once per table across detection and classification.
         """
-        headers = table.get("headers", [])
         rows = table.get("rows", [])
-        
-        if not headers or not rows:
+
+        if not header_text or not rows:
             return False
-        
+
         # Check for characteristic headers
-        header_text = " ".join(str(h).lower() for h in headers)
         has_property_header = "property" in header_text
         
         # Check for key-value pattern in rows (first column ends with ":")
         key_value_pattern_count = 0
         for row in rows[:5]:  # Check first 5 rows
-            first_col = str(list(row.values())[0]) if row else ""
-            if first_col.endswith(":"):
+            first_col = str(next(iter(row.values()), ""))
+            # Direct index compare beats method dispatch for one-char suffixes
+            if first_col[-1:] == ":":
                 key_value_pattern_count += 1
         
         return has_property_header and key_value_pattern_count >= 3
@@ -444,33 +800,47 @@ class DoclingTransformer:
             "owner": {"name": "...", "purchase_date": "...", "purchase_price": "..."}
         }
         """
-        headers = table.get("headers", [])
-        rows = table.get("rows", [])
-        
         result = {
             "property": {},
             "property_manager": {},
             "owner": {}
         }
-        
+
         # Find which column has the property keys (usually first column, ends with ":")
         # Find which column has the property values (usually second column)
         # Find which column has property manager/owner info (usually third column)
-        
+        rows = table.get("rows", [])
+        columns = _table_columns(table)
+
+        if all(len(cells) == len(rows) for cells in columns.values()):
+            column_iter = iter(columns.values())
+            key_cells = next(column_iter, [])
+            value_cells = next(column_iter, [])
+            right_cells = next(column_iter, [])
+
+            if not value_cells:
+                return result
+            if len(right_cells) < len(key_cells):
+                right_cells = right_cells + [""] * (len(key_cells) - len(right_cells))
+            triples = zip(key_cells, value_cells, right_cells)
+        else:
+            # Ragged rows: the columnar view would shift values across
+            # rows, so read each row's cells positionally instead
+            triples = (
+                (values[0], values[1], values[2] if len(values) > 2 else "")
+                for values in (list(row.values()) for row in rows)
+                if len(values) >= 2
+            )
+
         current_right_section = "property_manager"  # Start with property manager
-        
-        for row in rows:
-            values = list(row.values())
-            if len(values) < 2:
-                continue
-            
-            # Parse left side (PROPERTY key-value pairs)
-            key_col = str(values[0]).strip()
-            value_col = str(values[1]).strip() if len(values) > 1 else ""
-            right_col = str(values[2]).strip() if len(values) > 2 else ""
+
+        for key_cell, value_cell, right_cell in triples:
+            key_col = str(key_cell).strip()
+            value_col = str(value_cell).strip()
+            right_col = str(right_cell).strip()
             
             # Extract property key-value
-            if key_col.endswith(":"):
+            if key_col[-1:] == ":":
                 key_name = self._normalize_property_key(key_col.rstrip(":"))
                 if key_name and value_col and value_col != "-":
                     result["property"][key_name] = self._normalize_value(value_col)
@@ -493,23 +863,14 @@ class DoclingTransformer:
     def _normalize_property_key(self, key: str) -> str:
         """Convert property key to snake_case."""
         key = key.lower().strip()
-        # Map common keys
-        key_map = {
-            "no. of units": "no_of_units",
-            "stories": "stories",
-            "avg. unit size": "avg_unit_size",
-            "type": "property_type",
-            "rent type": "rent_type",
-            "year built": "year_built",
-            "parking": "parking",
-            "distance to transit": "distance_to_transit",
-        }
-        return key_map.get(key, key.replace(" ", "_").replace(".", ""))
+        # Interning keeps one shared string per key across the batch;
+        # the mapped names are interned literals already
+        return _KEY_MAP.get(key) or sys.intern(key.translate(_KEY_TRANSLATE))
     
     def _parse_property_manager_value(self, value: str, target: Dict) -> None:
         """Parse a value from the property manager column."""
         # Check if it's a phone number
-        phone_match = re.match(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', value)
+        phone_match = _PHONE_RE.match(value)
         if phone_match:
             target["phone"] = value
             return
@@ -520,26 +881,25 @@ class DoclingTransformer:
     
     def _parse_owner_value(self, value: str, target: Dict) -> None:
         """Parse a value from the owner column."""
-        # Check if it's a purchase price (starts with $)
-        if value.startswith("$"):
-            # Extract price and per-unit if present
-            price_match = re.match(r'\$([\d,]+)(?:\s*\(([^)]+)\))?', value)
-            if price_match:
-                target["purchase_price"] = value
-                target["purchase_price_raw"] = price_match.group(1).replace(",", "")
-                if price_match.group(2):
-                    target["price_per_unit"] = price_match.group(2)
+        match = _OWNER_CELL_RE.search(value)
+
+        if match is None:
+            # Not a price or a date, so it's likely the owner name
+            if "name" not in target and value:
+                target["name"] = value
             return
-        
-        # Check if it's a purchase date (contains month/year or "Purchased")
-        date_match = re.search(r'(?:Purchased\s+)?([A-Za-z]+\s+\d{4}|\d{1,2}/\d{1,2}/\d{4})', value)
-        if date_match:
-            target["purchase_date"] = date_match.group(1) if "Purchased" not in value else value
+
+        # Purchase price (starts with $), with per-unit if present
+        price = match.group("price")
+        if price is not None:
+            target["purchase_price"] = value
+            target["purchase_price_raw"] = price.replace(",", "")
+            if match.group("per_unit"):
+                target["price_per_unit"] = match.group("per_unit")
             return
-        
-        # Otherwise, it's likely the owner name
-        if "name" not in target and value:
-            target["name"] = value
+
+        # Purchase date (month/year, slash date, or a "Purchased ..." phrase)
+        target["purchase_date"] = value if match.group("purchased") else match.group("date")
     
     def _extract_metrics_from_raw_text(self, raw_text: str) -> Optional[Dict[str, Any]]:
         """
@@ -552,75 +912,57 @@ class DoclingTransformer:
         
         We need to split this into 3 separate metric objects.
         """
-        # Find the metrics table in raw_text - look for patterns like "Current:" followed by values
-        # The table appears after ASKING RENTS section headers
-        metrics_pattern = r'\|\s*Current:\s*\|\s*\$[\d,]+\s*\|[^|]+\|\s*Current:\s*\|[^|]+\|[^|]+\|\s*Current:\s*\|[^|]+\|'
-        
-        if not re.search(metrics_pattern, raw_text):
+        # A qualifying row needs a '|'-delimited 'Label:' cell; the literal
+        # substring tests are a cheap C scan that skips the full regex pass
+        # on documents without a metrics table
+        if '|' not in raw_text or ':' not in raw_text:
             return None
-        
-        result = {
-            "asking_rents": {
-                "current": {"per_unit": None, "per_sf": None},
-                "last_quarter": {"per_unit": None, "per_sf": None},
-                "year_ago": {"per_unit": None, "per_sf": None},
-                "competitors": {"per_unit": None, "per_sf": None},
-                "submarket": {"per_unit": None, "per_sf": None}
-            },
-            "vacancy": {
-                "current": {"rate": None, "units": None},
-                "last_quarter": {"rate": None, "units": None},
-                "year_ago": {"rate": None, "units": None},
-                "competitors": {"rate": None, "units": None},
-                "submarket": {"rate": None, "units": None}
-            },
-            "absorption": {
-                "current": None,
-                "competitor_total": None,
-                "competitor_avg": None,
-                "submarket_total": None,
-                "submarket_avg": None
-            }
-        }
-        
+
+        # No separate "is there a metrics table?" probe scan: the row pattern
+        # itself decides, and result stays None when nothing matches
+        result = None
+
+        # Hoist the parsers to locals: each runs once per column per row
+        parse_currency = self._parse_currency
+        parse_percentage = self._parse_percentage
+        parse_units = self._parse_units
+        map_metric_label = self._map_metric_label
+        map_absorption_label = self._map_absorption_label
+
         # Parse each row of the metrics table
         # Pattern: | Label: | Value | Value | Label: | Value | Value | Label: | Value |
-        row_pattern = r'\|\s*([^|]+):\s*\|\s*([^|]+)\|\s*([^|]+)\|\s*([^|]+):\s*\|\s*([^|]+)\|\s*([^|]+)\|\s*([^|]+):\s*\|\s*([^|]+)\|'
-        
-        for match in re.finditer(row_pattern, raw_text):
+        for match in _METRICS_ROW_RE.finditer(raw_text):
+            groups = match.groups()
+
+            rent_key = map_metric_label(groups[0])
+            vacancy_key = map_metric_label(groups[3])
+            absorption_key = map_absorption_label(groups[6])
+
+            # Allocate the result skeleton lazily, on the first row whose
+            # labels actually belong to the metrics table
+            if result is None:
+                if not (rent_key or vacancy_key or absorption_key):
+                    continue
+                result = _new_metrics_skeleton()
+
             # ASKING RENTS (columns 1-3)
-            rent_label = match.group(1).strip().lower()
-            rent_per_unit = self._parse_currency(match.group(2).strip())
-            rent_per_sf = self._parse_currency(match.group(3).strip())
-            
-            # VACANCY (columns 4-6)
-            vacancy_label = match.group(4).strip().lower()
-            vacancy_rate = self._parse_percentage(match.group(5).strip())
-            vacancy_units = self._parse_units(match.group(6).strip())
-            
-            # ABSORPTION (columns 7-8)
-            absorption_label = match.group(7).strip().lower()
-            absorption_value = self._parse_units(match.group(8).strip())
-            
-            # Map to result structure
-            rent_key = self._map_metric_label(rent_label)
             if rent_key and rent_key in result["asking_rents"]:
                 result["asking_rents"][rent_key] = {
-                    "per_unit": rent_per_unit,
-                    "per_sf": rent_per_sf
+                    "per_unit": parse_currency(groups[1]),
+                    "per_sf": parse_currency(groups[2])
                 }
-            
-            vacancy_key = self._map_metric_label(vacancy_label)
+
+            # VACANCY (columns 4-6)
             if vacancy_key and vacancy_key in result["vacancy"]:
                 result["vacancy"][vacancy_key] = {
-                    "rate": vacancy_rate,
-                    "units": vacancy_units
+                    "rate": parse_percentage(groups[4]),
+                    "units": parse_units(groups[5])
                 }
-            
-            absorption_key = self._map_absorption_label(absorption_label)
+
+            # ABSORPTION (columns 7-8)
             if absorption_key:
-                result["absorption"][absorption_key] = absorption_value
-        
+                result["absorption"][absorption_key] = parse_units(groups[7])
+
         return result
     
     def _map_metric_label(self, label: str) -> Optional[str]:
@@ -649,7 +991,7 @@ class DoclingTransformer:
     
     def _parse_currency(self, value: str) -> Optional[float]:
         """Parse currency value like $1,456 or $1.50 /SF."""
-        match = re.search(r'\$?([\d,]+(?:\.\d+)?)', value)
+        match = _CURRENCY_RE.search(value)
         if match:
             try:
                 return float(match.group(1).replace(',', ''))
@@ -659,7 +1001,7 @@ class DoclingTransformer:
     
     def _parse_percentage(self, value: str) -> Optional[float]:
         """Parse percentage value like 9.7%."""
-        match = re.search(r'([\d.]+)%?', value)
+        match = _PERCENT_RE.search(value)
         if match:
             try:
                 return float(match.group(1))
@@ -670,14 +1012,13 @@ class DoclingTransformer:
     def _parse_units(self, value: str) -> Optional[int]:
         """Parse units value like '14 Units' or '(10) Units'."""
         # Handle negative values in parentheses like (10) Units
-        match = re.search(r'\(?([\d.]+)\)?\s*Units?', value, re.IGNORECASE)
+        match = _UNITS_RE.search(value)
         if match:
             try:
-                num = float(match.group(1))
-                # If it was in parentheses, it's negative
-                if '(' in value:
-                    num = -num
-                return num
+                num = float(match.group(2))
+                # The open paren is captured by the match itself, so negativity
+                # comes for free instead of rescanning the string
+                return -num if match.group(1) else num
             except ValueError:
                 pass
         return None
@@ -689,34 +1030,66 @@ class DoclingTransformer:
         for table in tables:
             headers = table.get("headers", [])
             rows = table.get("rows", [])
-            
-            table_data = {
+
+            formatted_rows = [{} for _ in rows]
+            total_units = 0
+            columns = _table_columns(table)
+
+            if all(len(cells) == len(rows) for cells in columns.values()):
+                # Walk the table column-by-column so headers are normalized
+                # once per column rather than once per cell
+                for header, cells in columns.items():
+                    normalized_key = self._normalize_header(header)
+
+                    for formatted_row, value in zip(formatted_rows, self._normalize_column(cells)):
+                        formatted_row[normalized_key] = value
+
+                    # Track totals: reduce the whole unit column in C instead
+                    # of an isinstance + add per cell
+                    if "unit" in normalized_key.lower():
+                        unit_values = np.fromiter(
+                            (value for value in cells if isinstance(value, (int, float))),
+                            dtype=np.int64,
+                        )
+                        total_units += int(unit_values.sum())
+            else:
+                # Ragged rows: the columnar view would shift values across
+                # rows wherever a header is missing, so walk row by row
+                for formatted_row, row in zip(formatted_rows, rows):
+                    for header, value in row.items():
+                        normalized_key = self._normalize_header(header)
+                        formatted_row[normalized_key] = self._normalize_value(value)
+
+                        # Track totals
+                        if "unit" in normalized_key.lower() and isinstance(value, (int, float)):
+                            total_units += int(value)
+
+            formatted.append({
                 "headers": headers,
                 "column_types": table.get("column_types", {}),
-                "rows": [],
+                "rows": formatted_rows,
                 "summary": {
-                    "total_units": 0,
+                    "total_units": total_units,
                     "total_rows": len(rows)
                 }
-            }
-            
-            for row in rows:
-                formatted_row = {}
-                for header, value in row.items():
-                    # Normalize header names
-                    normalized_key = self._normalize_header(header)
-                    formatted_row[normalized_key] = self._normalize_value(value)
-                    
-                    # Track totals
-                    if "unit" in normalized_key.lower() and isinstance(value, (int, float)):
-                        table_data["summary"]["total_units"] += int(value)
-                
-                table_data["rows"].append(formatted_row)
-            
-            formatted.append(table_data)
+            })
         
         return formatted
     
+    def _normalize_column(self, cells: List[Any]) -> List[Any]:
+        """
+        Normalize a whole column of cells in one pass.
+
+        Unit-breakdown columns are frequently all-numeric already; those
+        pass through untouched after one cheap scan instead of paying a
+        full _normalize_value call per cell.
+        """
+        if all(isinstance(value, (int, float)) for value in cells):
+            return cells
+
+        normalize_value = self._normalize_value
+        return [normalize_value(value) for value in cells]
+
     def _format_expenses(self, tables: List[Dict]) -> List[Dict]:
         """Format expense tables."""
         formatted = []
@@ -731,7 +1104,29 @@ class DoclingTransformer:
         
         return formatted
     
-    def _extract_property_info(self, sections: List[Dict], raw_text: str) -> Dict[str, Any]:
+    def _classify_sections(self, sections: List[Dict]) -> Dict[str, List[int]]:
+        """
+        Bucket section indices by type in one scan of the headers.
+
+        Each header gets one pass of the fused category alternation; a
+        header mentioning several types lands in each matching bucket,
+        like the old per-type searches did.
+        """
+        buckets: Dict[str, List[int]] = {}
+
+        for idx, section in enumerate(sections):
+            header = section.get("header", "")
+            matched = {m.lastgroup for m in self._SECTION_CATEGORY_RE.finditer(header)}
+            header_upper = header.upper()
+            for token, bucket in self._HDR_TOKEN_BUCKETS.items():
+                if token in header_upper:
+                    matched.add(bucket)
+            for section_type in matched:
+                buckets.setdefault(section_type, []).append(idx)
+
+        return buckets
+
+    def _extract_property_info(self, section_buckets: Dict[str, List[int]], section_texts: Dict[int, str], raw_text: str) -> Dict[str, Any]:
         """Extract property information from sections and raw text."""
         property_info = {
             "no_of_units": None,
@@ -742,39 +1137,35 @@ class DoclingTransformer:
             "type": None,
             "rent_type": None,
         }
-        
+
         # Search in sections
-        property_sections = self._find_sections_by_type(sections, 'property')
-        for section in property_sections:
-            content = " ".join(section.get("content", []))
-            self._extract_key_values(content, property_info)
-        
+        for idx in section_buckets.get('property', ()):
+            self._extract_key_values(section_texts[idx], property_info)
+
         # Search in raw text as backup
         self._extract_key_values(raw_text, property_info)
-        
+
         return property_info
     
-    def _extract_owner_info(self, sections: List[Dict], raw_text: str) -> Dict[str, Any]:
+    def _extract_owner_info(self, section_buckets: Dict[str, List[int]], section_texts: Dict[int, str], raw_text: str) -> Dict[str, Any]:
         """Extract owner information."""
         owner_info = {
             "name": None,
             "purchase_date": None,
             "purchase_price": None,
         }
-        
-        owner_sections = self._find_sections_by_type(sections, 'owner')
-        for section in owner_sections:
-            content = " ".join(section.get("content", []))
-            self._extract_key_values(content, owner_info)
-        
+
+        for idx in section_buckets.get('owner', ()):
+            self._extract_key_values(section_texts[idx], owner_info)
+
         self._extract_key_values(raw_text, owner_info)
-        
+
         return owner_info
     
     def _extract_rate_info(
         self,
-        sections: List[Dict],
-        raw_text: str,
+        section_buckets: Dict[str, List[int]],
+        section_texts: Dict[int, str],
         rate_type: str
     ) -> Dict[str, Any]:
         """Extract vacancy or absorption rate information."""
@@ -786,66 +1177,71 @@ class DoclingTransformer:
             "submarket_total": None,
             "submarket_avg": None,
         }
-        
-        rate_sections = self._find_sections_by_type(sections, rate_type)
-        for section in rate_sections:
-            content = " ".join(section.get("content", []))
-            self._extract_key_values(content, rate_info)
-        
+
+        for idx in section_buckets.get(rate_type, ()):
+            self._extract_key_values(section_texts[idx], rate_info)
+
         return rate_info
     
     def _extract_amenities(self, sections: List[Dict], raw_text: str) -> List[str]:
         """Extract site amenities list."""
         amenities = []
-        
-        amenity_sections = self._find_sections_by_type(sections, 'amenities')
+        seen = set()
+
+        amenity_sections = [sections[i] for i in self._section_indices_by_type(sections, 'amenities')]
         for section in amenity_sections:
             for content in section.get("content", []):
                 # Split by common delimiters
-                items = re.split(r'[,\n•\-]', content)
+                items = content.translate(_AMENITY_TRANS).split('\n')
                 for item in items:
                     cleaned = item.strip()
                     if cleaned and len(cleaned) > 2:
+                        seen.add(cleaned)
                         amenities.append(cleaned)
-        
+
         # Also search raw text for amenities pattern
-        amenity_match = re.search(
-            r'(?:SITE\s+)?AMENITIES[:\s]*(.+?)(?=\n\n|\Z)',
-            raw_text,
-            re.IGNORECASE | re.DOTALL
-        )
+        amenity_match = _AMENITY_BLOCK_RE.search(raw_text)
         if amenity_match:
-            items = re.split(r'[,\n•\-]', amenity_match.group(1))
+            items = amenity_match.group(1).translate(_AMENITY_TRANS).split('\n')
             for item in items:
                 cleaned = item.strip()
-                if cleaned and len(cleaned) > 2 and cleaned not in amenities:
+                if cleaned and len(cleaned) > 2 and cleaned not in seen:
+                    seen.add(cleaned)
                     amenities.append(cleaned)
-        
+
         return amenities
     
-    def _extract_all_amenities(self, sections: List[Dict], raw_text: str, tables: List[Dict]) -> Dict[str, List[str]]:
+    def _extract_all_amenities(
+        self,
+        sections: List[Dict],
+        section_buckets: Dict[str, List[int]],
+        raw_slices: Dict[str, str],
+        tables: List[Dict]
+    ) -> Dict[str, List[str]]:
         """
         Extract both site and unit amenities, handling markdown table format.
-        
+
         Site Amenities often appear as markdown tables like:
         | 24 Hour Access | Business Center | Clubhouse |
-        
+
         Unit Amenities typically appear as plain lists.
         """
         result = {
             "site": [],
             "unit": []
         }
-        
-        # Extract Site Amenities from raw_text markdown tables
-        site_amenities_match = re.search(
-            r'## SITE AMENITIES\s*\n([\s\S]*?)(?=\n## |\n<!-- image -->|$)',
-            raw_text
-        )
-        if site_amenities_match:
-            site_text = site_amenities_match.group(1)
+
+        # One dedup set per amenity kind, shared across every source below,
+        # so membership checks stay O(1) instead of rescanning the lists
+        seen_site = set()
+        seen_unit = set()
+
+        # Extract Site Amenities from the pre-sliced raw_text block
+        site_text = raw_slices.get("SITE AMENITIES")
+        if site_text is not None:
             result["site"] = self._parse_amenities_from_text(site_text)
-        
+            seen_site.update(result["site"])
+
         # Also check tables for site amenities (table index 5 in the example)
         for table in tables:
             headers = table.get("headers", [])
@@ -854,59 +1250,76 @@ class DoclingTransformer:
                 for row in table.get("rows", []):
                     for value in row.values():
                         if value and isinstance(value, str) and len(value) > 2:
-                            if value not in result["site"]:
+                            if value not in seen_site:
+                                seen_site.add(value)
                                 result["site"].append(value)
-        
+
         # Extract Unit Amenities from sections
-        unit_sections = [s for s in sections if "UNIT AMENITIES" in s.get("header", "").upper()]
-        for section in unit_sections:
-            for content in section.get("content", []):
+        for idx in section_buckets.get("unit_amenities", ()):
+            for content in sections[idx].get("content", []):
                 cleaned = content.strip()
-                if cleaned and len(cleaned) > 2 and cleaned not in result["unit"]:
+                if cleaned and len(cleaned) > 2 and cleaned not in seen_unit:
+                    seen_unit.add(cleaned)
                     result["unit"].append(cleaned)
-        
-        # Also parse from raw_text
-        unit_amenities_match = re.search(
-            r'## UNIT AMENITIES\s*\n([\s\S]*?)(?=\n## |\n<!-- |$)',
-            raw_text
-        )
-        if unit_amenities_match:
-            unit_text = unit_amenities_match.group(1)
-            for line in unit_text.split('\n'):
-                cleaned = line.strip()
-                if cleaned and len(cleaned) > 2 and not cleaned.startswith('#') and cleaned not in result["unit"]:
+
+        # Also parse from the pre-sliced raw_text block; the strip/length/
+        # prefix filters run as vectorized numpy passes over all lines
+        unit_text = raw_slices.get("UNIT AMENITIES")
+        if unit_text is not None:
+            stripped = np.char.strip(np.array(unit_text.split('\n'), dtype=str))
+            mask = (np.char.str_len(stripped) > 2) & ~np.char.startswith(stripped, '#')
+            for cleaned in stripped[mask].tolist():
+                if cleaned not in seen_unit:
+                    seen_unit.add(cleaned)
                     result["unit"].append(cleaned)
-        
+
         return result
     
     def _parse_amenities_from_text(self, text: str) -> List[str]:
         """Parse amenities from text that may contain markdown tables."""
         amenities = []
-        
+        seen = set()
+
+        # Plain amenity lists (no table rows at all) filter in a few
+        # vectorized numpy passes instead of a per-line Python loop
+        if '|' not in text:
+            stripped = np.char.strip(np.array(text.split('\n'), dtype=str))
+            mask = (np.char.str_len(stripped) > 2) & ~np.char.startswith(stripped, '#')
+            for line in stripped[mask].tolist():
+                if line not in seen:
+                    seen.add(line)
+                    amenities.append(line)
+            return amenities
+
         for line in text.split('\n'):
             line = line.strip()
             if not line:
                 continue
-            
+
             # Check if it's a markdown table row
             if '|' in line:
-                # Parse markdown table cells
-                cells = line.split('|')
-                for cell in cells:
-                    cleaned = cell.strip()
-                    # Skip empty cells, separators, and headers
-                    if cleaned and len(cleaned) > 2 and not cleaned.startswith('-'):
-                        if cleaned not in amenities:
-                            amenities.append(cleaned)
+                # One regex scan extracts the stripped cells; skip empty
+                # cells, separators, and headers
+                for cell in _MD_CELL_RE.findall('|' + line + '|'):
+                    if len(cell) > 2 and not cell.startswith('-'):
+                        if cell not in seen:
+                            seen.add(cell)
+                            amenities.append(cell)
             else:
                 # Plain text line
                 if len(line) > 2 and not line.startswith('#'):
-                    if line not in amenities:
+                    if line not in seen:
+                        seen.add(line)
                         amenities.append(line)
-        
+
         return amenities
     
-    def _extract_recurring_expenses(self, sections: List[Dict], raw_text: str) -> Dict[str, Any]:
+    def _extract_recurring_expenses(
+        self,
+        sections: List[Dict],
+        section_buckets: Dict[str, List[int]],
+        raw_slices: Dict[str, str]
+    ) -> Dict[str, Any]:
         """
         Extract recurring expenses (utilities included in rent).
         
@@ -918,18 +1331,13 @@ class DoclingTransformer:
         }
         
         # Search in sections
-        recurring_sections = [s for s in sections if "RECURRING EXPENSES" in s.get("header", "").upper()]
-        for section in recurring_sections:
-            for content in section.get("content", []):
+        for idx in section_buckets.get("recurring_expenses", ()):
+            for content in sections[idx].get("content", []):
                 self._parse_recurring_expense(content, expenses)
         
-        # Search in raw_text
-        recurring_match = re.search(
-            r'## RECURRING EXPENSES\s*\n([\s\S]*?)(?=\n## |$)',
-            raw_text
-        )
-        if recurring_match:
-            expense_text = recurring_match.group(1).strip()
+        # Search in the pre-sliced raw_text block
+        expense_text = raw_slices.get("RECURRING EXPENSES")
+        if expense_text is not None:
             self._parse_recurring_expense(expense_text, expenses)
         
         return expenses
@@ -943,20 +1351,26 @@ class DoclingTransformer:
         # Store the full description
         if not expenses["description"]:
             expenses["description"] = text
-        
-        # Common utilities to look for
-        utilities = [
-            "gas", "water", "electricity", "electric", "heat", "heating",
-            "trash", "garbage", "sewer", "cable", "internet", "wifi"
-        ]
-        
+
         text_lower = text.lower()
-        for utility in utilities:
-            if utility in text_lower and utility not in [u.lower() for u in expenses["utilities_included"]]:
-                # Capitalize for display
-                expenses["utilities_included"].append(utility.capitalize())
+        included = {u.lower() for u in expenses["utilities_included"]}
+
+        if _UTIL_AUTOMATON is not None:
+            found = {keyword for _, keyword in _UTIL_AUTOMATON.iter(text_lower)}
+        else:
+            found = {keyword for keyword in _UTIL_CANON if keyword in text_lower}
+
+        for keyword, canonical in _UTIL_CANON.items():
+            if keyword in found and keyword not in included:
+                included.add(keyword)
+                expenses["utilities_included"].append(canonical)
     
-    def _extract_one_time_expenses(self, sections: List[Dict], raw_text: str) -> Dict[str, Any]:
+    def _extract_one_time_expenses(
+        self,
+        sections: List[Dict],
+        section_buckets: Dict[str, List[int]],
+        raw_slices: Dict[str, str]
+    ) -> Dict[str, Any]:
         """
         Extract one time expenses like Admin Fee, Application Fee.
         
@@ -965,18 +1379,13 @@ class DoclingTransformer:
         expenses = {}
         
         # Search in sections
-        expense_sections = [s for s in sections if "ONE TIME EXPENSES" in s.get("header", "").upper()]
-        for section in expense_sections:
-            for content in section.get("content", []):
+        for idx in section_buckets.get("one_time_expenses", ()):
+            for content in sections[idx].get("content", []):
                 self._parse_expense_item(content, expenses)
         
-        # Search in raw_text
-        expense_match = re.search(
-            r'## ONE TIME EXPENSES\s*\n([\s\S]*?)(?=\n## |\nPET POLICY|$)',
-            raw_text
-        )
-        if expense_match:
-            expense_text = expense_match.group(1)
+        # Search in the pre-sliced raw_text block
+        expense_text = raw_slices.get("ONE TIME EXPENSES")
+        if expense_text is not None:
             for line in expense_text.split('\n'):
                 self._parse_expense_item(line, expenses)
         
@@ -989,22 +1398,22 @@ class DoclingTransformer:
             return
         
         # Pattern: "Admin Fee $200" or "Application Fee $50"
-        admin_match = re.search(r'Admin\s*Fee\s*\$?([\d,]+)', text, re.IGNORECASE)
+        admin_match = _ADMIN_FEE_RE.search(text)
         if admin_match:
             expenses["admin_fee"] = float(admin_match.group(1).replace(',', ''))
-        
-        app_match = re.search(r'Application\s*Fee\s*\$?([\d,]+)', text, re.IGNORECASE)
+
+        app_match = _APPLICATION_FEE_RE.search(text)
         if app_match:
             expenses["application_fee"] = float(app_match.group(1).replace(',', ''))
-        
-        deposit_match = re.search(r'Deposit\s*\$?([\d,]+)', text, re.IGNORECASE)
+
+        deposit_match = _DEPOSIT_RE.search(text)
         if deposit_match:
             expenses["deposit"] = float(deposit_match.group(1).replace(',', ''))
     
-    def _extract_pet_policy(self, sections: List[Dict], raw_text: str) -> Dict[str, Any]:
+    def _extract_pet_policy(self, sections: List[Dict], raw_slices: Dict[str, str]) -> Dict[str, Any]:
         """
         Extract pet policy information.
-        
+
         Format: "Dog Allowed", "Cat Allowed"
         """
         policy = {
@@ -1012,14 +1421,11 @@ class DoclingTransformer:
             "cats_allowed": False,
             "restrictions": []
         }
-        
-        # Search in raw_text
-        pet_match = re.search(
-            r'PET POLICY\s*\n([\s\S]*?)(?=\n## |\n<!-- |$)',
-            raw_text
-        )
-        if pet_match:
-            pet_text = pet_match.group(1).lower()
+
+        # Search in the pre-sliced raw_text block
+        pet_text = raw_slices.get("PET POLICY")
+        if pet_text is not None:
+            pet_text = pet_text.lower()
             
             if 'dog allowed' in pet_text or 'dogs allowed' in pet_text:
                 policy["dogs_allowed"] = True
@@ -1030,104 +1436,70 @@ class DoclingTransformer:
                 policy["cats_allowed"] = False
             
             # Look for restrictions
-            restriction_patterns = [
-                r'breed restrictions?',
-                r'weight limit',
-                r'max (\d+) pets?',
-                r'pet deposit',
-                r'pet rent'
-            ]
-            for pattern in restriction_patterns:
-                match = re.search(pattern, pet_text, re.IGNORECASE)
+            for pattern in _PET_RESTRICTION_RES:
+                match = pattern.search(pet_text)
                 if match:
                     policy["restrictions"].append(match.group(0))
         
         return policy
     
-    def _find_sections_by_type(
+    def _section_indices_by_type(
         self,
         sections: List[Dict],
         section_type: str
-    ) -> List[Dict]:
-        """Find sections matching a type based on header patterns."""
-        matching = []
-        patterns = self.SECTION_PATTERNS.get(section_type, [])
-        
-        for section in sections:
-            header = section.get("header", "")
-            for pattern in patterns:
-                if re.search(pattern, header, re.IGNORECASE):
-                    matching.append(section)
-                    break
-        
-        return matching
+    ) -> List[int]:
+        """
+        Find indices of sections matching a type based on header patterns.
+
+        Indices let callers pair each matching section with its pre-joined
+        text in the parallel section_texts list.
+        """
+        pattern = self._SECTION_TYPE_RE.get(section_type)
+        if pattern is None:
+            return []
+
+        return [i for i, s in enumerate(sections) if pattern.search(s.get("header", ""))]
     
     def _extract_key_values(self, text: str, target: Dict[str, Any]) -> None:
-        """Extract key-value pairs from text into target dict."""
-        
-        # Common extraction patterns
-        patterns = {
-            "no_of_units": [
-                r'(\d+)\s*(?:Units?|Apartments?)',
-                r'Property\s+Size[:\s]*(\d+)',
-            ],
-            "stories": [
-                r'(\d+)\s*(?:Stor(?:y|ies)|Floor)',
-            ],
-            "avg_unit_size": [
-                r'Avg\.?\s*Unit\s*Size[:\s]*(\d+(?:,\d+)?)\s*SF',
-                r'Average\s*(?:Unit\s*)?Size[:\s]*(\d+)',
-            ],
-            "year_built": [
-                r'Year\s*Built[:\s]*(\d{4})',
-                r'Built\s*(?:in\s*)?(\d{4})',
-            ],
-            "parking": [
-                r'Parking[:\s]*(.+?)(?:\n|$)',
-            ],
-            "name": [
-                r'Owner[:\s]*(.+?)(?:\n|$)',
-                r'Property\s*Manager[:\s]*(.+?)(?:\n|$)',
-            ],
-            "purchase_date": [
-                r'Purchase\s*Date[:\s]*(.+?)(?:\n|$)',
-                r'Acquired[:\s]*(.+?)(?:\n|$)',
-            ],
-            "purchase_price": [
-                r'Purchase\s*Price[:\s]*(\$[\d,]+(?:\s*\([^)]+\))?)',
-                r'Sale\s*Price[:\s]*(\$[\d,]+)',
-            ],
-            "current": [
-                r'Current[:\s]*([\d.]+%?\s*(?:Units?)?)',
-            ],
-            "submarket_total": [
-                r'Submarket(?:\s*Total)?[:\s]*([\d,]+\s*(?:Units?)?)',
-            ],
-            "submarket_avg": [
-                r'Submarket\s*Avg[:\s]*([\d.]+\s*(?:Units?)?)',
-            ],
+        """
+        Extract key-value pairs from text into target dict.
+
+        One pass of the fused _KV_RE alternation serves every key; each
+        key keeps the first value matched for it in document order. The
+        scan stops as soon as every extractable key is filled, so calls
+        against an already-saturated target cost no regex work at all.
+        """
+        remaining = {
+            key for key, _ in _KV_GROUP_TO_KEY.values()
+            if key in target and target[key] is None
         }
-        
-        for key, key_patterns in patterns.items():
-            if key in target and target[key] is None:
-                for pattern in key_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        target[key] = match.group(1).strip()
-                        break
+        if not remaining:
+            return
+
+        for match in _KV_RE.finditer(text):
+            key, group = _KV_GROUP_TO_KEY[match.lastgroup]
+            if key in remaining:
+                target[key] = match.group(group).strip()
+                remaining.discard(key)
+                if not remaining:
+                    return
     
-    def _normalize_header(self, header: str) -> str:
-        """Normalize table header to consistent format."""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _normalize_header(header: str) -> str:
+        """Normalize table header to consistent format (memoized)."""
         # Convert to camelCase
-        words = re.split(r'[\s_\-]+', str(header).strip())
+        words = _HEADER_SPLIT_RE.split(str(header).strip())
         if not words:
             return header
-        
+
         result = words[0].lower()
         for word in words[1:]:
             result += word.capitalize()
-        
-        return result
+
+        # Headers recur as row-dict keys across every table and document;
+        # interning collapses them to one shared string each
+        return sys.intern(result)
     
     def _normalize_value(self, value: Any) -> Any:
         """Normalize a value (handle currency, percentages, etc.)."""
@@ -1138,22 +1510,31 @@ class DoclingTransformer:
             return value
         
         value_str = str(value).strip()
-        
+
         # Handle special cases
-        if value_str == '-' or value_str.lower() == 'n/a':
+        if value_str.lower() in _NA_STRINGS:
             return None
-        
+
+        # Fast path: a clean numeric after stripping $/%/commas is one
+        # float() call; the regexes below only run for messier formats
+        stripped = value_str.lstrip('$').rstrip('%').replace(',', '')
+        if stripped.replace('.', '', 1).isdigit():
+            try:
+                return float(stripped)
+            except ValueError:
+                pass
+
         # Try to extract numeric value
         # Currency: $1,234.56
-        currency_match = re.match(r'\$?([\d,]+(?:\.\d+)?)', value_str.replace(',', ''))
+        currency_match = _VALUE_CURRENCY_RE.match(value_str.replace(',', ''))
         if currency_match:
             try:
                 return float(currency_match.group(1))
             except ValueError:
                 pass
-        
+
         # Percentage: 10.5%
-        percent_match = re.match(r'([\d.]+)%', value_str)
+        percent_match = _VALUE_PERCENT_RE.match(value_str)
         if percent_match:
             try:
                 return float(percent_match.group(1))
@@ -1163,17 +1544,36 @@ class DoclingTransformer:
         return value_str
 
 
-def transform_docling_output(docling_output: Dict[str, Any]) -> Dict[str, Any]:
+# Shared transformers (one per keep_raw flavor) so the result cache
+# survives across transform_docling_output calls
+_SHARED_TRANSFORMERS: Dict[bool, DoclingTransformer] = {}
+
+
+def transform_docling_output(
+    docling_output: Dict[str, Any],
+    keep_raw: bool = False,
+    cache: bool = False
+) -> Dict[str, Any]:
     """
     Convenience function to transform Docling output.
-    
+
     Args:
         docling_output: Raw output from DoclingProcessor.process()
-        
+        keep_raw: Retain tables_raw/sections_raw/pages in the output
+        cache: Reuse a shared transformer whose result cache short-
+            circuits repeat documents
+
     Returns:
         Transformed output matching existing schema
     """
-    transformer = DoclingTransformer()
+    if cache:
+        transformer = _SHARED_TRANSFORMERS.get(keep_raw)
+        if transformer is None:
+            transformer = _SHARED_TRANSFORMERS[keep_raw] = DoclingTransformer(
+                keep_raw=keep_raw, use_cache=True
+            )
+    else:
+        transformer = DoclingTransformer(keep_raw=keep_raw)
     return transformer.transform(docling_output)
 
 
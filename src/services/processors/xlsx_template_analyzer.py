@@ -11,9 +11,13 @@ Output: Template Schema JSON that maps semantic field names to cell locations.
 """
 
 import json
+import os
 import sys
 import logging
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
@@ -21,7 +25,31 @@ from datetime import datetime
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell.cell import Cell
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils import get_column_letter, column_index_from_string, range_boundaries
+from openpyxl.utils.exceptions import InvalidFileException
+
+# Optional orjson for schema serialization - large templates produce
+# megabytes of schema JSON and orjson encodes them in C, falling back to
+# stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object to JSON bytes, preferring orjson when installed.
+
+    Datetimes go through default=str on both paths so the schema bytes
+    do not depend on which encoder is available.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +58,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger('xlsx_template_analyzer')
 
+# Label heuristics fused into one precompiled alternation: text ending
+# with a colon, or a bare common label word. Compiling at import keeps
+# the per-cell hot path out of the re module's pattern cache
+# All 16384 column letters precomputed once; a list index replaces the
+# divmod loop inside get_column_letter on every cell
+_COL_LETTERS = [None] + [get_column_letter(i) for i in range(1, 16385)]
+
+_FORMULA_HEAD_RE = re.compile(r'^=(SUM|AVERAGE|IF|VLOOKUP|XLOOKUP)\(')
+_FORMULA_HEAD_DESC = {
+    'SUM': 'Sum calculation',
+    'AVERAGE': 'Average calculation',
+    'IF': 'Conditional calculation',
+    'VLOOKUP': 'Lookup reference',
+    'XLOOKUP': 'Lookup reference',
+}
+_FORMULA_OP_DESC = (
+    ('*', 'Multiplication calculation'),
+    ('/', 'Division calculation'),
+    ('+', 'Addition calculation'),
+    ('-', 'Subtraction calculation'),
+)
+_LABEL_RE = re.compile(
+    r'(?:^\s*[\w\s]+:\s*$)'
+    r'|(?:^(?:Total|Subtotal|Sum|Average|Count|Date|Name|Address|Property|Unit|Rent|Price|Rate|Fee|Cost|Amount|Number|#|No\.|Type|Status|Notes?|Description|Comments?)\s*:?\s*$)',
+    re.IGNORECASE,
+)
+
 
 class CellType:
     """Cell type constants."""
@@ -40,6 +95,48 @@ class CellType:
     HEADER = "header"
 
 
+# Marker for CellInfo fields that should not appear in the serialized dict
+# (None is a real value for some of them, e.g. label or is_bold)
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class CellInfo:
+    """
+    Per-cell analysis record.
+
+    A slotted record is far lighter than the ten-key dict previously
+    built for every non-empty cell; the dict form is produced once at
+    serialization time via to_dict().
+    """
+    cell: str
+    row: int
+    column: int
+    column_letter: str
+    type: str
+    is_merged: bool
+    merge_master: Any = _UNSET
+    formula: Any = _UNSET
+    description: Any = _UNSET
+    text: Any = _UNSET
+    current_value: Any = _UNSET
+    data_type: Any = _UNSET
+    number_format: Any = _UNSET
+    label: Any = _UNSET
+    json_path: Any = _UNSET
+    label_cell: Any = _UNSET
+    is_bold: Any = _UNSET
+    has_fill: Any = _UNSET
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the schema dict shape, omitting unset fields."""
+        return {
+            field.name: value
+            for field in fields(self)
+            if (value := getattr(self, field.name)) is not _UNSET
+        }
+
+
 class XLSXTemplateAnalyzer:
     """
     Analyzes XLSX templates to extract structure for auto-filling.
@@ -67,10 +164,12 @@ class XLSXTemplateAnalyzer:
         Returns:
             Template schema dictionary with structure information
         """
+        # Resolve the path once; the error branch reuses it
+        self.template_path = Path(file_path)
+
         try:
             logger.info(f"Analyzing XLSX template: {file_path}")
-            self.template_path = Path(file_path)
-            
+
             # Load workbook with data_only=False to preserve formulas
             self.workbook = load_workbook(file_path, data_only=False)
             
@@ -83,28 +182,116 @@ class XLSXTemplateAnalyzer:
                 "sheets": []
             }
             
-            # Analyze each sheet
-            for sheet_name in self.workbook.sheetnames:
-                logger.info(f"Analyzing sheet: {sheet_name}")
-                sheet = self.workbook[sheet_name]
-                sheet_schema = self._analyze_sheet(sheet)
-                schema["sheets"].append(sheet_schema)
+            # Analyze each sheet; multi-sheet workbooks fan out across a
+            # process pool since sheets are independent and the per-cell
+            # analysis is GIL-bound Python. Each worker loads its own
+            # workbook copy, so results come back in sheet order
+            schema["sheets"] = list(
+                self._iter_sheet_schemas(file_path, self.workbook.sheetnames)
+            )
             
             # Generate summary statistics
             schema["summary"] = self._generate_summary(schema)
-            
+
+            # Release the parsed workbook promptly
+            self.workbook.close()
+
             logger.info(f"Analysis complete: {schema['summary']['total_input_fields']} input fields, "
                        f"{schema['summary']['total_formula_fields']} formula fields")
             
             return schema
             
-        except Exception as e:
+        except (OSError, KeyError, ValueError, InvalidFileException, zipfile.BadZipFile) as e:
             logger.error(f"Error analyzing template: {str(e)}")
             return {
                 "error": str(e),
-                "template_name": Path(file_path).stem if file_path else "unknown"
+                "template_name": self.template_path.stem or "unknown"
             }
-    
+
+    def analyze_to_file(self, file_path: str, output_path: str) -> Dict[str, Any]:
+        """
+        Analyze an XLSX template, streaming the schema JSON to disk.
+
+        Produces the same schema as analyze(), but each sheet is encoded
+        and written as soon as it is analyzed, so peak memory is bounded
+        by the largest sheet instead of the whole workbook.
+
+        Returns the summary block (the full schema lives on disk), or an
+        error dictionary mirroring analyze() on failure.
+        """
+        # Resolve the path once; the error branch reuses it
+        self.template_path = Path(file_path)
+
+        try:
+            logger.info(f"Analyzing XLSX template: {file_path}")
+
+            # Load workbook with data_only=False to preserve formulas
+            self.workbook = load_workbook(file_path, data_only=False)
+            sheet_names = self.workbook.sheetnames
+
+            summary = {
+                "total_input_fields": 0,
+                "total_formula_fields": 0,
+                "total_labels": 0,
+                "sheets": []
+            }
+
+            with open(output_path, 'wb') as out:
+                # Envelope, written by hand so sheets can stream into it
+                out.write(b'{"template_name": ' + _encode(self.template_path.stem))
+                out.write(b', "file_path": ' + _encode(str(self.template_path)))
+                out.write(b', "analysis_date": ' + _encode(datetime.now().isoformat()))
+                out.write(b', "sheet_count": ' + _encode(len(sheet_names)))
+                out.write(b', "sheets": [')
+
+                for index, sheet_schema in enumerate(self._iter_sheet_schemas(file_path, sheet_names)):
+                    if index:
+                        out.write(b', ')
+                    out.write(_encode(sheet_schema))
+
+                    sheet_summary = self._summarize_sheet(sheet_schema)
+                    summary["total_input_fields"] += sheet_summary["input_fields"]
+                    summary["total_formula_fields"] += sheet_summary["formula_fields"]
+                    summary["total_labels"] += sheet_summary["labels"]
+                    summary["sheets"].append(sheet_summary)
+
+                out.write(b'], "summary": ' + _encode(summary) + b'}')
+
+            # Release the parsed workbook promptly
+            self.workbook.close()
+
+            logger.info(f"Analysis complete: {summary['total_input_fields']} input fields, "
+                       f"{summary['total_formula_fields']} formula fields")
+
+            return summary
+
+        except (OSError, KeyError, ValueError, InvalidFileException, zipfile.BadZipFile) as e:
+            logger.error(f"Error analyzing template: {str(e)}")
+            error_schema = {
+                "error": str(e),
+                "template_name": self.template_path.stem or "unknown"
+            }
+            Path(output_path).write_bytes(_encode(error_schema, indent=True))
+            return error_schema
+
+    def _iter_sheet_schemas(self, file_path: str, sheet_names: List[str]):
+        """Yield sheet schemas in workbook order, fanning out when it pays."""
+        workers = min(os.cpu_count() or 1, len(sheet_names))
+        # Each worker re-parses the file, so the pool only pays off
+        # with real parallelism: single-core boxes stay sequential
+        if workers >= 2:
+            logger.info(f"Analyzing {len(sheet_names)} sheets on {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(
+                    _analyze_sheet_worker,
+                    [(file_path, name) for name in sheet_names],
+                )
+        else:
+            for sheet_name in sheet_names:
+                logger.info(f"Analyzing sheet: {sheet_name}")
+                yield self._analyze_sheet(self.workbook[sheet_name])
+
+
     def _analyze_sheet(self, sheet: Worksheet) -> Dict[str, Any]:
         """Analyze a single worksheet."""
         sheet_schema = {
@@ -120,12 +307,21 @@ class XLSXTemplateAnalyzer:
             "data_validations": []
         }
         
-        # Track merged cells
-        for merged_range in sheet.merged_cells.ranges:
-            sheet_schema["merged_regions"].append({
-                "range": str(merged_range),
-                "start_cell": merged_range.coord.split(":")[0]
-            })
+        # Track merged cells. partition avoids the list split(":") builds,
+        # and the region dicts reuse the same master string that seeds the
+        # O(1) coordinate -> master lookup below, so the per-cell analysis
+        # never rescans the range list
+        merged_ranges = sheet.merged_cells.ranges
+        sheet_schema["merged_regions"] = [
+            {"range": mr.coord, "start_cell": mr.coord.partition(":")[0]}
+            for mr in merged_ranges
+        ]
+        merged_master: Dict[Tuple[int, int], str] = {}
+        for merged_range, region in zip(merged_ranges, sheet_schema["merged_regions"]):
+            master = region["start_cell"]
+            for row in range(merged_range.min_row, merged_range.max_row + 1):
+                for col in range(merged_range.min_col, merged_range.max_col + 1):
+                    merged_master[(row, col)] = master
         
         # Track data validations
         if sheet.data_validations:
@@ -141,130 +337,170 @@ class XLSXTemplateAnalyzer:
         # Identify potential header rows (first few rows often contain headers)
         header_rows = self._detect_header_rows(sheet)
         
-        # Analyze each cell
-        for row_idx in range(1, sheet.max_row + 1):
-            for col_idx in range(1, sheet.max_column + 1):
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                cell_info = self._analyze_cell(cell, sheet, row_idx in header_rows)
-                
+        # Analyze each cell, streaming whole rows off the worksheet
+        # instead of re-resolving every (row, column) coordinate through
+        # sheet.cell; the header-row test also drops to once per row.
+        # Bounds come from the declared dimensions so the walk covers
+        # exactly the used range and row numbering stays explicit
+        min_col, min_row, max_col, max_row = range_boundaries(sheet.dimensions)
+        rows = sheet.iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+        )
+        # Spatial indexes for label association, filled during the same
+        # walk that classifies the cells: labels keyed by position,
+        # headers by column (first one in a column wins)
+        label_at: Dict[Tuple[int, int], CellInfo] = {}
+        header_by_col: Dict[int, CellInfo] = {}
+        for row_idx, row in enumerate(rows, start=min_row):
+            is_header_row = row_idx in header_rows
+            for cell in row:
+                cell_info = self._analyze_cell(cell, merged_master, is_header_row)
+
                 if cell_info:
                     # Categorize the cell
-                    if cell_info["type"] == CellType.FORMULA:
+                    if cell_info.type == CellType.FORMULA:
                         sheet_schema["formula_fields"].append(cell_info)
-                    elif cell_info["type"] == CellType.INPUT:
+                    elif cell_info.type == CellType.INPUT:
                         sheet_schema["input_fields"].append(cell_info)
-                    elif cell_info["type"] == CellType.HEADER:
+                    elif cell_info.type == CellType.HEADER:
                         sheet_schema["headers"].append(cell_info)
-                    elif cell_info["type"] == CellType.LABEL:
+                        header_by_col.setdefault(cell_info.column, cell_info)
+                    elif cell_info.type == CellType.LABEL:
                         sheet_schema["labels"].append(cell_info)
-        
-        # Try to associate labels with input fields
-        sheet_schema["input_fields"] = self._associate_labels(
-            sheet_schema["input_fields"],
-            sheet_schema["labels"],
-            sheet_schema["headers"]
-        )
-        
+                        label_at[(cell_info.row, cell_info.column)] = cell_info
+
+        # Associate labels with input fields based on proximity: the
+        # label directly to the left, then above, then the column header
+        for field in sheet_schema["input_fields"]:
+            label = (
+                label_at.get((field.row, field.column - 1))
+                or label_at.get((field.row - 1, field.column))
+                or header_by_col.get(field.column)
+            )
+            if label:
+                field.label = label.text
+                field.label_cell = label.cell
+
+        # Serialize the slotted records into the schema dict shape
+        for key in ("input_fields", "formula_fields", "labels", "headers"):
+            sheet_schema[key] = [info.to_dict() for info in sheet_schema[key]]
+
         return sheet_schema
     
     def _analyze_cell(
-        self, 
-        cell: Cell, 
-        sheet: Worksheet, 
+        self,
+        cell: Cell,
+        merged_master: Dict[Tuple[int, int], str],
         is_header_row: bool
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[CellInfo]:
         """
         Analyze a single cell and determine its type and properties.
-        
+
         Returns None for truly empty cells with no significance.
         """
-        cell_ref = f"{get_column_letter(cell.column)}{cell.row}"
-        
+        # Resolve the style/value properties once; openpyxl re-derives
+        # them from the style table on every attribute access
+        value = cell.value
+        font = cell.font
+        fill = cell.fill
+        number_format = cell.number_format
+        column_letter = _COL_LETTERS[cell.column]
+        cell_ref = f"{column_letter}{cell.row}"
+
         # Check if cell is part of a merged region
-        is_merged = False
-        merge_master = None
-        for merged_range in sheet.merged_cells.ranges:
-            if cell.coordinate in merged_range:
-                is_merged = True
-                merge_master = merged_range.coord.split(":")[0]
-                # Skip non-master cells in merged regions
-                if cell.coordinate != merge_master:
-                    return None
-                break
-        
+        merge_master = merged_master.get((cell.row, cell.column))
+        is_merged = merge_master is not None
+        # Skip non-master cells in merged regions
+        if is_merged and cell.coordinate != merge_master:
+            return None
+
         # Determine cell type
-        cell_type = self._determine_cell_type(cell, is_header_row)
-        
+        cell_type = self._determine_cell_type(cell, value, font, number_format, is_header_row)
+
         if cell_type == CellType.EMPTY:
             return None
-        
+
         # Build cell info
-        cell_info = {
-            "cell": cell_ref,
-            "row": cell.row,
-            "column": cell.column,
-            "column_letter": get_column_letter(cell.column),
-            "type": cell_type,
-            "is_merged": is_merged
-        }
-        
+        cell_info = CellInfo(
+            cell=cell_ref,
+            row=cell.row,
+            column=cell.column,
+            column_letter=column_letter,
+            type=cell_type,
+            is_merged=is_merged
+        )
+
         if merge_master:
-            cell_info["merge_master"] = merge_master
-        
+            cell_info.merge_master = merge_master
+
         # Add type-specific information
         if cell_type == CellType.FORMULA:
-            cell_info["formula"] = str(cell.value)
-            cell_info["description"] = self._describe_formula(str(cell.value))
+            formula = str(value)
+            cell_info.formula = formula
+            cell_info.description = self._describe_formula(formula)
         elif cell_type in [CellType.LABEL, CellType.HEADER]:
-            cell_info["text"] = str(cell.value) if cell.value else ""
+            cell_info.text = str(value) if value else ""
         elif cell_type == CellType.INPUT:
-            cell_info["current_value"] = cell.value
-            cell_info["data_type"] = self._get_data_type(cell)
-            cell_info["number_format"] = cell.number_format
-            cell_info["label"] = None  # Will be filled by _associate_labels
-            cell_info["json_path"] = None  # Will be filled during mapping
-        
+            cell_info.current_value = value
+            cell_info.data_type = self._get_data_type(cell, value, number_format)
+            cell_info.number_format = number_format
+            cell_info.label = None  # Will be filled by _associate_labels
+            cell_info.json_path = None  # Will be filled during mapping
+
         # Add formatting info for context
-        if cell.font:
-            cell_info["is_bold"] = cell.font.bold
-        if cell.fill and cell.fill.fgColor:
-            cell_info["has_fill"] = cell.fill.fgColor.rgb != "00000000"
-        
+        if font:
+            cell_info.is_bold = font.bold
+        if fill and fill.fgColor:
+            # Only resolve .rgb when a pattern is actually set: most cells
+            # have no fill, and theme/indexed colors resolve rgb to None,
+            # which must not count as a real fill either
+            if fill.patternType:
+                rgb = getattr(fill.fgColor, "rgb", None)
+                cell_info.has_fill = rgb not in (None, "00000000", "FFFFFFFF")
+            else:
+                cell_info.has_fill = False
+
         return cell_info
     
-    def _determine_cell_type(self, cell: Cell, is_header_row: bool) -> str:
-        """Determine the type of a cell."""
-        value = cell.value
-        
+    def _determine_cell_type(
+        self,
+        cell: Cell,
+        value: Any,
+        font: Any,
+        number_format: Optional[str],
+        is_header_row: bool
+    ) -> str:
+        """Determine the type of a cell from its pre-resolved properties."""
         # Empty cell
-        if value is None or (isinstance(value, str) and not value.strip()):
+        if value is None:
             return CellType.EMPTY
-        
-        # Formula cell
-        if isinstance(value, str) and value.startswith("="):
-            return CellType.FORMULA
-        
-        # Header row cells are headers
-        if is_header_row and isinstance(value, str):
-            return CellType.HEADER
-        
-        # Check if it's a label (text that describes adjacent cells)
-        if isinstance(value, str):
+
+        # The string test gates most branches below; run it once
+        is_str = isinstance(value, str)
+        if is_str:
+            if not value.strip():
+                return CellType.EMPTY
+
+            # Formula cell
+            if value.startswith("="):
+                return CellType.FORMULA
+
+            # Header row cells are headers
+            if is_header_row:
+                return CellType.HEADER
+
             # Labels often end with ":" or are short descriptive text
-            if value.endswith(":") or self._is_likely_label(value, cell):
+            if value.endswith(":") or self._is_likely_label(value, cell, font):
                 return CellType.LABEL
-        
+
         # Check for input fields
-        if self._is_likely_input(cell):
+        if self._is_likely_input(cell, value, number_format):
             return CellType.INPUT
-        
+
         # Default to label for text, input for numbers
-        if isinstance(value, str):
-            return CellType.LABEL
-        else:
-            return CellType.INPUT
+        return CellType.LABEL if is_str else CellType.INPUT
     
-    def _is_likely_label(self, value: str, cell: Cell) -> bool:
+    def _is_likely_label(self, value: str, cell: Cell, font: Any) -> bool:
         """
         Determine if a text value is likely a label.
         
@@ -277,28 +513,23 @@ class XLSXTemplateAnalyzer:
         """
         if not value:
             return False
-        
-        # Common label patterns
-        label_patterns = [
-            r'^\s*[\w\s]+:\s*$',  # Ends with colon
-            r'^(Total|Subtotal|Sum|Average|Count|Date|Name|Address|Property|Unit|Rent|Price|Rate|Fee|Cost|Amount|Number|#|No\.|Type|Status|Notes?|Description|Comments?)\s*:?\s*$',
-        ]
-        
-        for pattern in label_patterns:
-            if re.match(pattern, value, re.IGNORECASE):
-                return True
-        
-        # Short text in column A or B is often a label
+
+        # Cheap positional and formatting checks first: short text in
+        # column A or B, or bold text, is often a label
         if cell.column <= 2 and len(value) < 30:
             return True
-        
-        # Bold text is often a label
-        if cell.font and cell.font.bold:
+        if font and font.bold:
             return True
-        
+
+        # The regex only runs for plausible candidates - short text in
+        # the leftmost columns - which keeps the hot path off the re
+        # machinery for the (mostly numeric or far-right) bulk of cells
+        if cell.column <= 4 and len(value) <= 50 and _LABEL_RE.match(value):
+            return True
+
         return False
-    
-    def _is_likely_input(self, cell: Cell) -> bool:
+
+    def _is_likely_input(self, cell: Cell, value: Any, number_format: Optional[str]) -> bool:
         """
         Determine if a cell is likely an input field.
         
@@ -308,106 +539,61 @@ class XLSXTemplateAnalyzer:
         - Cells with data validation
         - Cells in "data" columns (not A or B)
         """
-        value = cell.value
-        
         # Numbers are usually input
         if isinstance(value, (int, float)):
             return True
-        
+
         # Dates are input
         if cell.is_date:
             return True
-        
+
         # Cells with specific number formats
-        if cell.number_format and cell.number_format != "General":
+        if number_format and number_format != "General":
             return True
-        
+
         return False
     
     def _detect_header_rows(self, sheet: Worksheet) -> set:
         """Detect which rows are likely header rows."""
         header_rows = set()
-        
-        # First row is often a header
-        if sheet.max_row > 0:
-            first_row_cells = [sheet.cell(row=1, column=c).value for c in range(1, min(10, sheet.max_column + 1))]
-            if any(isinstance(v, str) and v for v in first_row_cells):
-                header_rows.add(1)
-        
-        # Look for rows where most cells are bold text
-        for row_idx in range(1, min(10, sheet.max_row + 1)):
+
+        if sheet.max_row < 1:
+            return header_rows
+
+        # One streaming pass over the top-left window instead of ~200
+        # random-access sheet.cell fetches
+        scan_rows = sheet.iter_rows(
+            min_row=1,
+            max_row=min(9, sheet.max_row),
+            max_col=min(19, sheet.max_column),
+        )
+        for row_idx, row in enumerate(scan_rows, start=1):
             bold_count = 0
             text_count = 0
-            for col_idx in range(1, min(20, sheet.max_column + 1)):
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                if cell.value and isinstance(cell.value, str):
+            for cell in row:
+                value = cell.value
+                if value and isinstance(value, str):
                     text_count += 1
-                    if cell.font and cell.font.bold:
+                    font = cell.font
+                    if font and font.bold:
                         bold_count += 1
-            
+
+            # First row is often a header if it has any text at all
+            if row_idx == 1 and any(
+                isinstance(cell.value, str) and cell.value for cell in row[:9]
+            ):
+                header_rows.add(1)
+
             # If most text cells are bold, it's likely a header row
             if text_count > 0 and bold_count / text_count > 0.5:
                 header_rows.add(row_idx)
-        
+
         return header_rows
     
-    def _associate_labels(
-        self,
-        input_fields: List[Dict],
-        labels: List[Dict],
-        headers: List[Dict]
-    ) -> List[Dict]:
-        """
-        Associate labels with input fields based on proximity.
-        
-        Labels are typically directly to the left or above input fields.
-        """
-        for field in input_fields:
-            row = field["row"]
-            col = field["column"]
-            
-            # Look for label to the left
-            left_label = self._find_label_at(labels, row, col - 1)
-            if left_label:
-                field["label"] = left_label["text"]
-                field["label_cell"] = left_label["cell"]
-                continue
-            
-            # Look for label above
-            above_label = self._find_label_at(labels, row - 1, col)
-            if above_label:
-                field["label"] = above_label["text"]
-                field["label_cell"] = above_label["cell"]
-                continue
-            
-            # Look for header in same column
-            col_header = next(
-                (h for h in headers if h["column"] == col),
-                None
-            )
-            if col_header:
-                field["label"] = col_header["text"]
-                field["label_cell"] = col_header["cell"]
-        
-        return input_fields
-    
-    def _find_label_at(
-        self,
-        labels: List[Dict],
-        row: int,
-        col: int
-    ) -> Optional[Dict]:
-        """Find a label at a specific position."""
-        for label in labels:
-            if label["row"] == row and label["column"] == col:
-                return label
-        return None
-    
-    def _get_data_type(self, cell: Cell) -> str:
+    def _get_data_type(self, cell: Cell, value: Any, number_format: Optional[str]) -> str:
         """Determine the expected data type for an input cell."""
-        value = cell.value
-        number_format = cell.number_format or "General"
-        
+        number_format = number_format or "General"
+
         # Check number format first
         if "$" in number_format or "Currency" in number_format:
             return "currency"
@@ -430,57 +616,56 @@ class XLSXTemplateAnalyzer:
     
     def _describe_formula(self, formula: str) -> str:
         """Generate a human-readable description of a formula."""
-        # Common formula patterns
-        if formula.upper().startswith("=SUM("):
-            return "Sum calculation"
-        if formula.upper().startswith("=AVERAGE("):
-            return "Average calculation"
-        if formula.upper().startswith("=IF("):
-            return "Conditional calculation"
-        if formula.upper().startswith("=VLOOKUP(") or formula.upper().startswith("=XLOOKUP("):
-            return "Lookup reference"
-        if "*" in formula:
-            return "Multiplication calculation"
-        if "/" in formula:
-            return "Division calculation"
-        if "+" in formula:
-            return "Addition calculation"
-        if "-" in formula:
-            return "Subtraction calculation"
-        
+        # Well-known function heads resolve from one uppercase pass and
+        # a single anchored match instead of five startswith probes
+        match = _FORMULA_HEAD_RE.match(formula.upper())
+        if match:
+            return _FORMULA_HEAD_DESC[match.group(1)]
+
+        for operator, description in _FORMULA_OP_DESC:
+            if operator in formula:
+                return description
+
         return "Formula calculation"
     
+    @staticmethod
+    def _summarize_sheet(sheet_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the summary entry for one analyzed sheet."""
+        return {
+            "name": sheet_schema["name"],
+            "input_fields": len(sheet_schema["input_fields"]),
+            "formula_fields": len(sheet_schema["formula_fields"]),
+            "labels": len(sheet_schema["labels"])
+        }
+
     def _generate_summary(self, schema: Dict) -> Dict[str, Any]:
         """Generate summary statistics for the schema."""
-        total_input = 0
-        total_formula = 0
-        total_labels = 0
-        sheets_summary = []
-        
-        for sheet in schema["sheets"]:
-            input_count = len(sheet["input_fields"])
-            formula_count = len(sheet["formula_fields"])
-            label_count = len(sheet["labels"])
-            
-            total_input += input_count
-            total_formula += formula_count
-            total_labels += label_count
-            
-            sheets_summary.append({
-                "name": sheet["name"],
-                "input_fields": input_count,
-                "formula_fields": formula_count,
-                "labels": label_count
-            })
-        
+        sheets_summary = [self._summarize_sheet(sheet) for sheet in schema["sheets"]]
+
         return {
-            "total_input_fields": total_input,
-            "total_formula_fields": total_formula,
-            "total_labels": total_labels,
+            "total_input_fields": sum(s["input_fields"] for s in sheets_summary),
+            "total_formula_fields": sum(s["formula_fields"] for s in sheets_summary),
+            "total_labels": sum(s["labels"] for s in sheets_summary),
             "sheets": sheets_summary
         }
 
 
+def _analyze_sheet_worker(args: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    Analyze one sheet in a worker process.
+
+    Workbooks do not pickle, so each worker opens its own copy of the
+    file and hands back the plain-dict sheet schema.
+    """
+    file_path, sheet_name = args
+    logger.info(f"Analyzing sheet: {sheet_name}")
+    workbook = load_workbook(file_path, data_only=False)
+    try:
+        return XLSXTemplateAnalyzer()._analyze_sheet(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+
 def main():
     """CLI entry point for analyzing XLSX templates."""
     if len(sys.argv) < 2:
@@ -499,17 +684,16 @@ def main():
         }))
         sys.exit(1)
     
-    # Analyze the template
+    # Analyze the template. With an output path the schema streams to
+    # disk sheet by sheet, so peak memory never holds the whole schema
     analyzer = XLSXTemplateAnalyzer()
-    schema = analyzer.analyze(xlsx_path)
-    
-    # Output result
     if output_path:
-        with open(output_path, 'w') as f:
-            json.dump(schema, f, indent=2, default=str)
+        analyzer.analyze_to_file(xlsx_path, output_path)
         print(json.dumps({"status": "success", "output_path": output_path}))
     else:
-        print(json.dumps(schema, indent=2, default=str))
+        schema = analyzer.analyze(xlsx_path)
+        sys.stdout.buffer.write(_encode(schema, indent=True))
+        sys.stdout.buffer.write(b"\n")
 
 
 if __name__ == "__main__":
@@ -16,13 +16,23 @@ import json
 import sys
 import logging
 import re
-import shutil
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils.cell import coordinate_to_tuple
+
+# Optional orjson for parsing the extract and mappings files - large
+# Docling extracts decode several times faster in C, falling back to
+# stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +41,223 @@ logging.basicConfig(
 )
 logger = logging.getLogger('xlsx_template_filler')
 
+# Precompiled patterns for the JSON-path walker and value transforms;
+# both run once per mapping per array row, so compiling at import keeps
+# the hot path out of the re module's pattern cache
+_PATH_SPLIT_RE = re.compile(r'\.(?![^\[]*\])')
+_ARRAY_IDX_RE = re.compile(r'(\w+)\[(\d+)\]')
+_NUM_CLEAN_RE = re.compile(r'[^0-9.-]')
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_PROP_NAME_UNIT_RE = re.compile(r'^(.+?)\s+\d+\s+Unit')
+_PROP_NAME_ALPHA_RE = re.compile(r'^([A-Za-z\s]+)')
+_STATE_RE = re.compile(r',\s*([A-Za-z\s]+?)(?:\s*-|$)')
+
+
+# State-name -> abbreviation map for the extract_state_abbrev transform,
+# built once at import instead of per call
+_STATE_ABBREVS = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
+    'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+}
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, preferring orjson when installed."""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1024)
+def _cell_coord(cell_ref: str) -> Tuple[int, int]:
+    """
+    Resolve an A1-style reference to (row, column) indexes.
+
+    Mapping cell refs repeat across fills, so the parse is cached and
+    sheet access goes through sheet.cell() without re-running openpyxl's
+    coordinate regex.
+    """
+    return coordinate_to_tuple(cell_ref)
+
+
+@lru_cache(maxsize=512)
+def _compile_path(path: str) -> tuple:
+    """
+    Parse a JSON path into (part, array_key, array_index) steps.
+
+    Mappings repeat the same handful of path strings for every array
+    row, so the parsed form is cached at module scope and shared across
+    filler instances.
+    """
+    steps = []
+    for part in _PATH_SPLIT_RE.split(path):
+        array_match = _ARRAY_IDX_RE.match(part)
+        if array_match:
+            steps.append((part, array_match.group(1), int(array_match.group(2))))
+        else:
+            steps.append((part, None, None))
+    return tuple(steps)
+
+
+def _t_divide_by_100(value: Any) -> Any:
+    """Convert percentage from whole number to decimal."""
+    try:
+        return float(value) / 100
+    except (ValueError, TypeError):
+        return value
+
+
+# Deletion table stripping every ASCII character that cannot appear in
+# a number; translate runs the filter in C, well under the regex cost
+_NUM_DEL_TABLE = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(128) if chr(i) not in set('0123456789.-'))
+)
+
+
+def _t_to_number(value: Any) -> Any:
+    """Convert string to number, removing formatting."""
+    if isinstance(value, str):
+        try:
+            if value.isascii():
+                cleaned = value.translate(_NUM_DEL_TABLE)
+            else:
+                cleaned = _NUM_CLEAN_RE.sub('', value)
+            return float(cleaned)
+        except ValueError:
+            return value
+    return value
+
+
+# Year captured once at the top of fill(); the years_since_purchase
+# transform reads it instead of asking the clock on every row
+_fill_year = None
+
+
+def _t_years_since_purchase(value: Any) -> Any:
+    """Extract year from "Purchased Mar 2019" and calculate years."""
+    if isinstance(value, str):
+        year_match = _YEAR_RE.search(value)
+        if year_match:
+            purchase_year = int(year_match.group())
+            current_year = _fill_year or datetime.now().year
+            return current_year - purchase_year
+    return value
+
+
+def _t_extract_property_name(value: Any) -> Any:
+    """
+    Extract property name from "Urban 148 148 Unit Apartment Building".
+
+    Take text before "Unit" or first number sequence.
+    """
+    if isinstance(value, str):
+        # Try to find pattern like "Name ### Unit"
+        match = _PROP_NAME_UNIT_RE.match(value)
+        if match:
+            return match.group(1).strip()
+        # Fallback: take first part before numbers
+        match = _PROP_NAME_ALPHA_RE.match(value)
+        if match:
+            return match.group(1).strip()
+    return value
+
+
+def _t_extract_city(value: Any) -> Any:
+    """Extract city from "Phoenix, Arizona - North Phoenix Neighborhood"."""
+    if isinstance(value, str):
+        # Take text before first comma
+        parts = value.split(',')
+        if parts:
+            return parts[0].strip()
+    return value
+
+
+def _t_extract_state_abbrev(value: Any) -> Any:
+    """Extract state abbreviation from "Phoenix, Arizona - North Phoenix Neighborhood"."""
+    if isinstance(value, str):
+        # Look for state name after comma, before dash or end
+        match = _STATE_RE.search(value)
+        if match:
+            state_name = match.group(1).strip().lower()
+            return _STATE_ABBREVS.get(state_name, state_name.upper()[:2])
+    return value
+
+
+# Transform dispatch: one dict lookup replaces the old if/elif chain, so
+# every transform resolves in O(1) regardless of how many exist
+_TRANSFORMS = {
+    "divide_by_100": _t_divide_by_100,
+    "to_number": _t_to_number,
+    "years_since_purchase": _t_years_since_purchase,
+    "extract_property_name": _t_extract_property_name,
+    "extract_city": _t_extract_city,
+    "extract_state_abbrev": _t_extract_state_abbrev,
+}
+
+
+@dataclass(slots=True)
+class CompiledMapping:
+    """
+    One single-cell mapping, parsed once when the mappings load.
+
+    The cell ref is resolved to (row, col) and the transform names to
+    their handlers up front, so the per-fill loop reads slots instead of
+    re-interpreting the mapping dict field by field.
+    """
+    cell: Optional[str]
+    row: Optional[int]
+    col: Optional[int]
+    label: Optional[str]
+    notes: Optional[str]
+    source: str
+    json_path: Optional[str]
+    json_root_override: Optional[str]
+    transform: Optional[Callable[[Any], Any]]
+    fallback_path: Optional[str]
+    fallback_transform: Optional[Callable[[Any], Any]]
+
+
+def _compile_mappings(field_mappings: Dict[str, Any]) -> Dict[str, List[CompiledMapping]]:
+    """Parse each sheet's single-cell mappings into CompiledMapping records."""
+    compiled = {}
+    for sheet_name, sheet_config in field_mappings.get("sheets", {}).items():
+        entries = []
+        for mapping in sheet_config.get("mappings", []):
+            cell_ref = mapping.get("cell")
+            try:
+                row, col = _cell_coord(cell_ref) if cell_ref else (None, None)
+            except (ValueError, TypeError, AttributeError):
+                # Malformed refs are reported per mapping at fill time
+                # instead of failing the whole compile
+                row = col = None
+            entries.append(CompiledMapping(
+                cell=cell_ref,
+                row=row,
+                col=col,
+                label=mapping.get("label"),
+                notes=mapping.get("notes"),
+                source=mapping.get("source", "pdf_extract"),
+                json_path=mapping.get("json_path"),
+                json_root_override=mapping.get("json_root_override"),
+                transform=_TRANSFORMS.get(mapping.get("transform")),
+                fallback_path=mapping.get("fallback_path"),
+                fallback_transform=_TRANSFORMS.get(mapping.get("fallback_transform")),
+            ))
+        compiled[sheet_name] = entries
+    return compiled
+
 
 class XLSXTemplateFiller:
     """
@@ -51,13 +278,14 @@ class XLSXTemplateFiller:
             mappings_path: Path to field_mappings.json
         """
         self.mappings = None
+        self._compiled = None
         if mappings_path:
             self.load_mappings(mappings_path)
-    
+
     def load_mappings(self, mappings_path: str) -> None:
-        """Load field mappings from JSON file."""
-        with open(mappings_path, 'r') as f:
-            self.mappings = json.load(f)
+        """Load field mappings from JSON file and precompile them."""
+        self.mappings = _load_json_file(mappings_path)
+        self._compiled = _compile_mappings(self.mappings)
         logger.info(f"Loaded field mappings: {self.mappings.get('template_name', 'unknown')}")
     
     def fill(
@@ -79,6 +307,8 @@ class XLSXTemplateFiller:
         Returns:
             Fill report with statistics and any errors
         """
+        global _fill_year
+
         try:
             # Use provided mappings or loaded mappings
             field_mappings = mappings or self.mappings
@@ -87,19 +317,24 @@ class XLSXTemplateFiller:
                     "status": "error",
                     "error": "No field mappings provided or loaded"
                 }
-            
+
             logger.info(f"Filling template: {template_path}")
+
+            # One clock read per fill: the output filename, the report
+            # timestamp, and the year-based transform all reuse it
+            now = datetime.now()
+            _fill_year = now.year
             
-            # Copy template to output location
+            # Work out the output location
             if not output_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 template_name = Path(template_path).stem
                 output_path = str(Path(template_path).parent / f"{template_name}_filled_{timestamp}.xlsx")
-            
-            shutil.copy2(template_path, output_path)
-            
-            # Load the copied workbook
-            workbook = load_workbook(output_path)
+
+            # Load the template directly; the filled workbook is saved to
+            # output_path below, which avoids copying the file on disk
+            # and then parsing the copy a second time
+            workbook = load_workbook(template_path)
             
             # Extract the root data from JSON
             json_root = field_mappings.get("json_root", "structured_data[0]")
@@ -119,12 +354,27 @@ class XLSXTemplateFiller:
                 "skipped_fields": [],
                 "external_fields": [],
                 "errors": [],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             }
             
-            # Process each sheet's mappings
+            # Process each sheet's mappings; ad-hoc mappings passed to
+            # this call compile here, loaded ones were compiled up front
+            if mappings is not None or self._compiled is None:
+                compiled_sheets = _compile_mappings(field_mappings)
+            else:
+                compiled_sheets = self._compiled
+
             sheets_config = field_mappings.get("sheets", {})
-            
+
+            # Each result status routes straight to its report list;
+            # _fill_cell only ever returns these four
+            buckets = {
+                "filled": fill_report["filled_fields"],
+                "skipped": fill_report["skipped_fields"],
+                "external": fill_report["external_fields"],
+                "error": fill_report["errors"],
+            }
+
             for sheet_name, sheet_config in sheets_config.items():
                 if sheet_name not in workbook.sheetnames:
                     logger.warning(f"Sheet not found in template: {sheet_name}")
@@ -137,10 +387,10 @@ class XLSXTemplateFiller:
                 sheet = workbook[sheet_name]
                 
                 # Process single-cell mappings
-                if "mappings" in sheet_config:
-                    for mapping in sheet_config["mappings"]:
-                        result = self._fill_cell(sheet, mapping, data, json_data)
-                        self._add_to_report(fill_report, sheet_name, mapping, result)
+                for mapping in compiled_sheets.get(sheet_name, ()):
+                    result = self._fill_cell(sheet, mapping, data, json_data)
+                    result["sheet"] = sheet_name
+                    buckets[result["status"]].append(result)
                 
                 # Process array-based mappings (like unit mix)
                 if "array_source" in sheet_config:
@@ -170,84 +420,78 @@ class XLSXTemplateFiller:
     def _fill_cell(
         self,
         sheet,
-        mapping: Dict[str, Any],
+        mapping: CompiledMapping,
         data: Dict[str, Any],
         full_json: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """
-        Fill a single cell based on mapping configuration.
-        
+        Fill a single cell from a precompiled mapping.
+
         Returns result dict with status and details.
         """
-        cell_ref = mapping.get("cell")
-        json_path = mapping.get("json_path")
-        source = mapping.get("source", "pdf_extract")
-        json_root_override = mapping.get("json_root_override")
-        
         # Handle external fields (no json_path)
-        if source == "external" or json_path is None:
+        if mapping.source == "external" or mapping.json_path is None:
             return {
                 "status": "external",
-                "cell": cell_ref,
-                "label": mapping.get("label"),
-                "notes": mapping.get("notes")
+                "cell": mapping.cell,
+                "label": mapping.label,
+                "notes": mapping.notes
             }
-        
+
         # Get value from JSON data
         # Use full_json if json_root_override is set (empty string means use root)
-        lookup_data = full_json if (json_root_override is not None and full_json) else data
-        value = self._navigate_json_path(lookup_data, json_path)
-        
+        lookup_data = full_json if (mapping.json_root_override is not None and full_json) else data
+        value = self._navigate_json_path(lookup_data, mapping.json_path)
+
         # Try fallback path if primary path didn't find a value
-        fallback_path = mapping.get("fallback_path")
-        fallback_transform = mapping.get("fallback_transform")
-        if value is None and fallback_path and full_json:
-            value = self._navigate_json_path(full_json, fallback_path)
+        if value is None and mapping.fallback_path and full_json:
+            value = self._navigate_json_path(full_json, mapping.fallback_path)
             # Apply fallback transform if specified
-            if value is not None and fallback_transform:
-                value = self._apply_transform(value, fallback_transform)
-        
+            if value is not None and mapping.fallback_transform:
+                value = mapping.fallback_transform(value)
+
         if value is None:
             return {
                 "status": "skipped",
-                "cell": cell_ref,
-                "label": mapping.get("label"),
-                "reason": f"No value found at path: {json_path}"
+                "cell": mapping.cell,
+                "label": mapping.label,
+                "reason": f"No value found at path: {mapping.json_path}"
             }
-        
+
         # Apply transformation if specified
-        transform = mapping.get("transform")
-        if transform:
-            value = self._apply_transform(value, transform)
-        
+        if mapping.transform:
+            value = mapping.transform(value)
+
         # Set the cell value
         try:
-            cell = sheet[cell_ref]
-            
+            if mapping.row is None:
+                raise ValueError(f"{mapping.cell} is not a valid coordinate or range")
+            cell = sheet.cell(row=mapping.row, column=mapping.col)
+
             # Check if cell has a formula (don't overwrite)
             if cell.value and isinstance(cell.value, str) and cell.value.startswith("="):
                 return {
                     "status": "skipped",
-                    "cell": cell_ref,
-                    "label": mapping.get("label"),
+                    "cell": mapping.cell,
+                    "label": mapping.label,
                     "reason": "Cell contains formula, not overwriting"
                 }
-            
+
             cell.value = value
-            
+
             return {
                 "status": "filled",
-                "cell": cell_ref,
-                "label": mapping.get("label"),
+                "cell": mapping.cell,
+                "label": mapping.label,
                 "value": value,
-                "json_path": json_path
+                "json_path": mapping.json_path
             }
-            
+
         except Exception as e:
             return {
                 "status": "error",
-                "cell": cell_ref,
-                "label": mapping.get("label"),
+                "cell": mapping.cell,
+                "label": mapping.label,
                 "error": str(e)
             }
     
@@ -270,10 +514,15 @@ class XLSXTemplateFiller:
         
         # Find the "Total" row - this marks the end of unit mix data area
         # We should only clear/delete rows BEFORE the Total row
+        # One streaming pass down column B instead of 50 random-access
+        # lookups that each parse a ref and materialize a Cell object
         total_row = None
         last_unit_row = row_start
-        for check_row in range(row_start, row_start + 50):
-            cell_val = sheet[f"B{check_row}"].value
+        column_b = sheet.iter_rows(
+            min_row=row_start, max_row=row_start + 49,
+            min_col=2, max_col=2, values_only=True
+        )
+        for check_row, (cell_val,) in enumerate(column_b, start=row_start):
             if cell_val is not None:
                 cell_str = str(cell_val).strip().lower()
                 if cell_str == "total" or cell_str == "totals":
@@ -291,18 +540,40 @@ class XLSXTemplateFiller:
         
         max_rows = rows_in_table  # Only process rows up to (but not including) Total row
         
+        # Resolve column letters to indexes once, so the loops below use
+        # sheet.cell(row, column) instead of re-parsing "A7"-style refs
+        # through openpyxl's coordinate regex on every access. Bad letters
+        # in clear_columns are dropped here (nothing to clear there);
+        # bad mapping columns are carried along and reported per cell
+        clear_col_set = set()
         for column in clear_columns:
-            if column:
-                for row_offset in range(max_rows):
-                    clear_row = row_start + row_offset
-                    cell_ref = f"{column}{clear_row}"
-                    try:
-                        cell = sheet[cell_ref]
-                        # Only clear if not a formula
-                        if not (cell.value and isinstance(cell.value, str) and cell.value.startswith("=")):
-                            cell.value = None
-                    except:
-                        pass
+            if not column:
+                continue
+            try:
+                clear_col_set.add(column_index_from_string(column))
+            except (ValueError, AttributeError):
+                logger.warning(f"Invalid clear column: {column}")
+
+        # Clear the region in one contiguous row-major pass; in practice
+        # the clear columns are adjacent, so this walks each row's cells
+        # once instead of re-addressing the sheet column by column. The
+        # same pass records where the formulas are, so the fill loop can
+        # test set membership instead of re-reading cell values per row
+        formula_cells = set()
+        clear_min_col = clear_max_col = 0
+        if clear_col_set and max_rows > 0:
+            clear_min_col, clear_max_col = min(clear_col_set), max(clear_col_set)
+            clear_region = sheet.iter_rows(
+                min_row=row_start, max_row=row_start + max_rows - 1,
+                min_col=clear_min_col, max_col=clear_max_col
+            )
+            for row in clear_region:
+                for cell in row:
+                    if cell.value and isinstance(cell.value, str) and cell.value.startswith("="):
+                        # Never cleared, and skipped outright when filling
+                        formula_cells.add((cell.row, cell.column))
+                    elif cell.column in clear_col_set:
+                        cell.value = None
         
         # Track how many actual data rows we'll fill (for later row deletion)
         rows_to_fill = 0
@@ -315,7 +586,26 @@ class XLSXTemplateFiller:
             return
         
         sheet_name = sheet.title
-        
+
+        # Bind the report lists once; appends in the hot loop then hit
+        # locals instead of re-doing the dict lookup per cell
+        filled_fields = fill_report["filled_fields"]
+        error_fields = fill_report["errors"]
+
+        # Column letters resolve to indexes once, not once per row; an
+        # unresolvable letter keeps its mapping with a None index so the
+        # fill loop can report it row by row without aborting the sheet
+        indexed_mappings = []
+        for col_mapping in column_mappings:
+            column = col_mapping.get("column")
+            if not column:
+                continue
+            try:
+                col_idx = column_index_from_string(column)
+            except (ValueError, AttributeError):
+                col_idx = None
+            indexed_mappings.append((col_mapping, column, col_idx))
+
         # Process each row of data
         for row_idx, row_data in enumerate(array_data):
             current_row = row_start + row_idx
@@ -329,14 +619,20 @@ class XLSXTemplateFiller:
             
             rows_to_fill += 1
             
-            for col_mapping in column_mappings:
-                column = col_mapping.get("column")
+            for col_mapping, column, col_idx in indexed_mappings:
+                # Known formula targets are skipped before any value
+                # lookup or transform work is spent on them
+                in_region = (
+                    col_idx is not None
+                    and clear_min_col <= col_idx <= clear_max_col
+                    and row_start <= current_row < row_start + max_rows
+                )
+                if in_region and (current_row, col_idx) in formula_cells:
+                    continue
+
                 json_field = col_mapping.get("json_field")
                 transform = col_mapping.get("transform")
-                
-                if not column:
-                    continue
-                
+
                 # Handle special transforms
                 if transform == "bed_bath_label":
                     # Create unit type label like "2B/1Ba" from bed and bath values
@@ -364,25 +660,30 @@ class XLSXTemplateFiller:
                     continue
                 
                 cell_ref = f"{column}{current_row}"
-                
+
                 try:
-                    cell = sheet[cell_ref]
-                    
-                    # Don't overwrite formulas
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith("="):
-                        continue
-                    
+                    if col_idx is None:
+                        raise ValueError(f"{cell_ref} is not a valid coordinate or range")
+                    cell = sheet.cell(row=current_row, column=col_idx)
+
+                    # The prescan already vouched for cells inside the
+                    # cleared region; only targets outside it still need
+                    # the direct formula check
+                    if not in_region:
+                        if cell.value and isinstance(cell.value, str) and cell.value.startswith("="):
+                            continue
+
                     cell.value = value
                     
-                    fill_report["filled_fields"].append({
+                    filled_fields.append({
                         "sheet": sheet_name,
                         "cell": cell_ref,
                         "label": col_mapping.get("label"),
                         "value": value
                     })
-                    
+
                 except Exception as e:
-                    fill_report["errors"].append({
+                    error_fields.append({
                         "sheet": sheet_name,
                         "cell": cell_ref,
                         "error": str(e)
@@ -412,23 +713,28 @@ class XLSXTemplateFiller:
         # FIRST: Try direct key lookup (handles keys with dots in name like "unitMix.units")
         if isinstance(data, dict) and path in data:
             return data[path]
-        
+
+        # Fast path: plain dotted paths ("property.name") need no array
+        # parsing, and str.split beats the compiled walker's machinery
+        if '[' not in path:
+            current = data
+            for part in path.split('.'):
+                if not isinstance(current, dict):
+                    return None
+                current = current.get(part)
+                if current is None:
+                    return None
+            return current
+
         current = data
-        
-        # Split path by dots, but handle array notation
-        parts = re.split(r'\.(?![^\[]*\])', path)
-        
-        for part in parts:
+
+        # Walk the cached parsed form of the path
+        for part, key, index in _compile_path(path):
             if current is None:
                 return None
-            
-            # Check for array indexing
-            array_match = re.match(r'(\w+)\[(\d+)\]', part)
-            
-            if array_match:
-                key = array_match.group(1)
-                index = int(array_match.group(2))
-                
+
+            if key is not None:
+                # Array indexing step
                 if isinstance(current, dict) and key in current:
                     current = current[key]
                     if isinstance(current, list) and index < len(current):
@@ -453,104 +759,9 @@ class XLSXTemplateFiller:
         return current
     
     def _apply_transform(self, value: Any, transform: str) -> Any:
-        """Apply a transformation to a value."""
-        if transform == "divide_by_100":
-            # Convert percentage from whole number to decimal
-            try:
-                return float(value) / 100
-            except (ValueError, TypeError):
-                return value
-        
-        elif transform == "to_number":
-            # Convert string to number, removing formatting
-            if isinstance(value, str):
-                try:
-                    cleaned = re.sub(r'[^0-9.-]', '', value)
-                    return float(cleaned)
-                except ValueError:
-                    return value
-            return value
-        
-        elif transform == "years_since_purchase":
-            # Extract year from "Purchased Mar 2019" and calculate years
-            if isinstance(value, str):
-                year_match = re.search(r'\b(19|20)\d{2}\b', value)
-                if year_match:
-                    purchase_year = int(year_match.group())
-                    current_year = datetime.now().year
-                    return current_year - purchase_year
-            return value
-        
-        elif transform == "extract_property_name":
-            # Extract property name from "Urban 148 148 Unit Apartment Building"
-            # Take text before "Unit" or first number sequence
-            if isinstance(value, str):
-                # Try to find pattern like "Name ### Unit"
-                match = re.match(r'^(.+?)\s+\d+\s+Unit', value)
-                if match:
-                    return match.group(1).strip()
-                # Fallback: take first part before numbers
-                match = re.match(r'^([A-Za-z\s]+)', value)
-                if match:
-                    return match.group(1).strip()
-            return value
-        
-        elif transform == "extract_city":
-            # Extract city from "Phoenix, Arizona - North Phoenix Neighborhood"
-            if isinstance(value, str):
-                # Take text before first comma
-                parts = value.split(',')
-                if parts:
-                    return parts[0].strip()
-            return value
-        
-        elif transform == "extract_state_abbrev":
-            # Extract state abbreviation from "Phoenix, Arizona - North Phoenix Neighborhood"
-            state_abbrevs = {
-                'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-                'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-                'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-                'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-                'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-                'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-                'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-                'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
-                'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-                'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
-                'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-                'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
-                'wisconsin': 'WI', 'wyoming': 'WY'
-            }
-            if isinstance(value, str):
-                # Look for state name after comma, before dash or end
-                match = re.search(r',\s*([A-Za-z\s]+?)(?:\s*-|$)', value)
-                if match:
-                    state_name = match.group(1).strip().lower()
-                    return state_abbrevs.get(state_name, state_name.upper()[:2])
-            return value
-        
-        return value
-    
-    def _add_to_report(
-        self,
-        report: Dict[str, Any],
-        sheet_name: str,
-        mapping: Dict[str, Any],
-        result: Dict[str, Any]
-    ) -> None:
-        """Add a fill result to the report."""
-        result["sheet"] = sheet_name
-        
-        status = result.get("status")
-        
-        if status == "filled":
-            report["filled_fields"].append(result)
-        elif status == "skipped":
-            report["skipped_fields"].append(result)
-        elif status == "external":
-            report["external_fields"].append(result)
-        elif status == "error":
-            report["errors"].append(result)
+        """Apply a named transformation to a value."""
+        handler = _TRANSFORMS.get(transform)
+        return handler(value) if handler else value
 
 
 def main():
@@ -575,8 +786,7 @@ def main():
             sys.exit(1)
     
     # Load JSON data
-    with open(json_path, 'r') as f:
-        json_data = json.load(f)
+    json_data = _load_json_file(json_path)
     
     # Create filler and fill template
     filler = XLSXTemplateFiller(mappings_path)